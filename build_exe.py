@@ -6,27 +6,98 @@ Python to be installed on the user's machine.
 
 Usage:
     pip install pyinstaller
-    python build_exe.py
+    python build_exe.py [--fast-start] [--force-clean] [--force]
+
+Options:
+    --fast-start    Build with --onedir instead of --onefile. The output is a
+                    folder instead of a single file, but the executable starts
+                    much faster because nothing has to be unpacked at launch.
+    --force-clean   Wipe PyInstaller's cache before each build. By default the
+                    cache is reused, which makes back-to-back builds much faster.
+                    Use this for release builds.
+    --force         Rebuild executables even if they are newer than their
+                    source script.
 """
 
+import argparse
+import glob
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import shutil
 import sys
 
-def build_executable(script_name, exe_name, icon_path=None):
-    """Build a standalone executable from a Python script."""
+# Packages that are never imported by the calculators or the launcher but may
+# be present in the build environment; excluding them keeps the bundles small.
+EXCLUDED_MODULES = ["pytest", "sklearn", "scipy", "pandas", "botocore"]
+
+# Run the PyInstaller installed for this interpreter (the one the import check found)
+PYINSTALLER_CMD = [sys.executable, "-m", "PyInstaller"]
+
+# PyInstaller 6.6 added --optimize, which compiles only the bundled bytecode
+# without docstrings and asserts (nothing in this project relies on either)
+OPTIMIZE_MIN_VERSION = (6, 6)
+
+# Standard library and test packages the calculators never import. unittest is
+# deliberately not listed: pyparsing (a matplotlib dependency) imports it.
+CALCULATOR_EXCLUDED_MODULES = [
+    "tkinter.test", "pydoc", "xmlrpc", "lib2to3", "distutils", "test",
+    "matplotlib.tests", "numpy.tests",
+]
+
+def get_optimize_args():
+    """Return the bytecode optimization option if the installed PyInstaller supports it."""
+    
+    import PyInstaller
+    version = tuple(int(part) for part in re.findall(r"\d+", PyInstaller.__version__)[:2])
+    return ["--optimize", "2"] if version >= OPTIMIZE_MIN_VERSION else []
+
+def get_output_path(exe_name, onedir=False):
+    """Return the path of the executable PyInstaller produces for exe_name."""
+    
+    filename = exe_name + ".exe" if os.name == 'nt' else exe_name
+    if onedir:
+        return os.path.join("dist", exe_name, filename)
+    return os.path.join("dist", filename)
+
+def is_up_to_date(script_name, exe_name, onedir=False, extra_sources=()):
+    """Check whether the built executable is newer than its source script and extra_sources."""
+    
+    exe_path = get_output_path(exe_name, onedir)
+    sources = [script_name, *extra_sources]
+    return (os.path.exists(exe_path) and
+            all(os.path.getmtime(exe_path) > os.path.getmtime(src) for src in sources))
+
+def build_executable(script_name, exe_name, icon_path=None, onedir=False, clean=False,
+                     config_dir=None, force=False):
+    """
+    Build a standalone executable from a Python script.
+
+    config_dir gives this build its own PyInstaller cache directory so that
+    several builds can safely run at the same time. Unless force is set, the
+    build is skipped when the executable is already newer than the script.
+    """
+    
+    # The calculators import quest_common.py, so a change there needs a rebuild too
+    if not force and is_up_to_date(script_name, exe_name, onedir,
+                                   extra_sources=["quest_common.py"]):
+        print(f"\n{exe_name} is up to date, skipping (use --force to rebuild)")
+        return True
     
     print(f"\nBuilding {exe_name}...")
     
     # Base PyInstaller command
-    cmd = [
-        "pyinstaller",
-        "--onefile",  # Single executable file
+    cmd = PYINSTALLER_CMD + [
+        # Single executable file, or a folder that skips unpacking at launch
+        "--onedir" if onedir else "--onefile",
         "--windowed",  # No console window (GUI only)
         "--name", exe_name,
-        "--clean",  # Clean build cache
-    ]
+        "--noconfirm",  # Overwrite previous output without asking
+    ] + get_optimize_args()
+    
+    if clean:
+        cmd.append("--clean")  # Clean build cache
     
     # Add icon if provided
     if icon_path and os.path.exists(icon_path):
@@ -36,39 +107,56 @@ def build_executable(script_name, exe_name, icon_path=None):
     cmd.extend([
         "--hidden-import", "matplotlib",
         "--hidden-import", "numpy",
-        "--hidden-import", "PIL",
         "--hidden-import", "tkinter",
     ])
     
+    for module in EXCLUDED_MODULES + CALCULATOR_EXCLUDED_MODULES:
+        cmd.extend(["--exclude-module", module])
+    
+    # Strip symbol tables from bundled binaries (not supported on Windows)
+    if os.name != 'nt':
+        cmd.append("--strip")
+    
     # Add the script to build
     cmd.append(script_name)
     
+    env = None
+    if config_dir:
+        env = os.environ.copy()
+        env["PYINSTALLER_CONFIG_DIR"] = os.path.abspath(config_dir)
+    
     try:
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, env=env)
         print(f"✓ Successfully built {exe_name}.exe")
         return True
     except subprocess.CalledProcessError as e:
         print(f"✗ Failed to build {exe_name}.exe: {e}")
         return False
 
-def build_launcher_exe():
+def build_launcher_exe(onedir=False, clean=False, force=False):
     """Build the launcher executable."""
     
+    if not force and is_up_to_date("launcher.py", "LoL_Quest_Calculator", onedir):
+        print("\nLoL_Quest_Calculator is up to date, skipping (use --force to rebuild)")
+        return True
+    
     print("\nBuilding launcher executable...")
     
-    cmd = [
-        "pyinstaller",
-        "--onefile",
+    cmd = PYINSTALLER_CMD + [
+        "--onedir" if onedir else "--onefile",
         "--console",  # Keep console for launcher menu
         "--name", "LoL_Quest_Calculator",
-        "--clean",
-    ]
+        "--noconfirm",
+    ] + get_optimize_args()
     
-    cmd.extend([
-        "--hidden-import", "matplotlib",
-        "--hidden-import", "numpy",
-        "--hidden-import", "tkinter",
-    ])
+    if clean:
+        cmd.append("--clean")
+    
+    # The launcher only uses the standard library. Frozen, it starts the
+    # LoL_Quest_Calculator_* executables next to it, so matplotlib/numpy are
+    # not bundled here
+    for module in EXCLUDED_MODULES:
+        cmd.extend(["--exclude-module", module])
     
     cmd.append("launcher.py")
     
@@ -86,26 +174,34 @@ def clean_build_files():
     print("\nCleaning up build files...")
     
     dirs_to_remove = ["build", "__pycache__"]
-    files_to_remove = [
-        "LoL_Quest_Calculator.spec",
-        "LoL_Quest_Calculator_Top.spec",
-        "LoL_Quest_Calculator_Mid.spec",
-        "LoL_Quest_Calculator_Bot.spec",
-    ]
+    files_to_remove = glob.glob("*.spec")
     
     for directory in dirs_to_remove:
         if os.path.exists(directory):
-            shutil.rmtree(directory)
+            if os.name == 'nt':
+                # Let Windows remove the whole tree natively instead of
+                # deleting thousands of small files one by one from Python
+                subprocess.run(["cmd", "/c", "rmdir", "/s", "/q", directory], check=False)
+            else:
+                shutil.rmtree(directory)
             print(f"  Removed {directory}/")
     
     for file in files_to_remove:
-        if os.path.exists(file):
-            os.remove(file)
-            print(f"  Removed {file}")
+        os.remove(file)
+        print(f"  Removed {file}")
 
 def main():
     """Main build process."""
     
+    parser = argparse.ArgumentParser(description="Build standalone calculator executables.")
+    parser.add_argument("--fast-start", action="store_true",
+                        help="build with --onedir for faster startup (folder instead of single file)")
+    parser.add_argument("--force-clean", action="store_true",
+                        help="clear PyInstaller's build cache before each build")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild executables even if they are up to date")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("LoL Quest Calculator - EXE Builder")
     print("=" * 60)
@@ -122,26 +218,53 @@ def main():
     print("The process may take several minutes...")
     
     # Build the main launcher (recommended approach)
-    success = build_launcher_exe()
+    success = build_launcher_exe(onedir=args.fast_start, clean=args.force_clean,
+                                 force=args.force)
     
     if success:
         print("\n" + "=" * 60)
         print("BUILD SUCCESSFUL!")
         print("=" * 60)
         print("\nThe executable can be found in the 'dist' folder:")
-        print("  dist/LoL_Quest_Calculator.exe")
-        print("\nThis single .exe contains everything needed to run all calculators.")
-        print("Users can run it without installing Python!")
+        if args.fast_start:
+            print("  dist/LoL_Quest_Calculator/LoL_Quest_Calculator.exe")
+            print("\nDistribute the whole LoL_Quest_Calculator folder, not just the .exe.")
+        else:
+            print("  dist/LoL_Quest_Calculator.exe")
+        print("\nThe launcher is only a menu: it starts the individual calculator .exe")
+        print("files, so it must be distributed together with them (build them below).")
         
         # Optional: Build individual calculator exes
         print("\n" + "-" * 60)
         response = input("\nBuild individual calculator .exe files? (y/n): ")
         if response.lower() == 'y':
             print("\nBuilding individual executables...")
-            build_executable("quest_timer_calculator_top.py", "LoL_Quest_Calculator_Top")
-            build_executable("quest_timer_calculator.py", "LoL_Quest_Calculator_Mid")
-            build_executable("quest_timer_calculator_bot.py", "LoL_Quest_Calculator_Bot")
-            print("\nIndividual executables built in dist/ folder")
+            calculators = [
+                ("quest_timer_calculator_top.py", "LoL_Quest_Calculator_Top"),
+                ("quest_timer_calculator.py", "LoL_Quest_Calculator_Mid"),
+                ("quest_timer_calculator_bot.py", "LoL_Quest_Calculator_Bot"),
+            ]
+            
+            # The builds are independent PyInstaller processes, so run them side by
+            # side; each one gets its own cache directory to avoid corrupting it.
+            # The caches live outside build/ so that cleaning up keeps them warm
+            with ThreadPoolExecutor(max_workers=len(calculators)) as executor:
+                futures = [
+                    executor.submit(build_executable, script, exe_name,
+                                    onedir=args.fast_start, clean=args.force_clean,
+                                    config_dir=os.path.join(".pyinstaller-cache", exe_name),
+                                    force=args.force)
+                    for script, exe_name in calculators
+                ]
+                results = [future.result() for future in futures]
+            
+            # The PyInstaller logs of the parallel builds are interleaved, so repeat
+            # any failures here where they can't be missed
+            failed = [exe_name for (_, exe_name), ok in zip(calculators, results) if not ok]
+            if failed:
+                print("\n✗ Failed to build: " + ", ".join(failed))
+            else:
+                print("\nIndividual executables built in dist/ folder")
     
     # Clean up
     print("\n" + "-" * 60)
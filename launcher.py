@@ -10,6 +10,43 @@ import sys
 import subprocess
 import os
 
+# A launcher built with PyInstaller has no Python interpreter to run the
+# calculator scripts with, so it starts the per-lane executables built by
+# build_exe.py instead. Those are looked for next to the launcher executable.
+_FROZEN = getattr(sys, 'frozen', False)
+_HERE = os.path.dirname(os.path.abspath(sys.executable if _FROZEN else __file__))
+
+_CALCULATOR_SCRIPTS = {
+    '1': ('Top Lane    (1200 points)', 'quest_timer_calculator_top.py', 'LoL_Quest_Calculator_Top'),
+    '2': ('Mid Lane    (1350 points)', 'quest_timer_calculator.py', 'LoL_Quest_Calculator_Mid'),
+    '3': ('Bot Lane    (1350 points)', 'quest_timer_calculator_bot.py', 'LoL_Quest_Calculator_Bot'),
+}
+
+def _calculator_command(script, exe_name):
+    """Return the command that starts a calculator, or None if it is missing."""
+    if not _FROZEN:
+        path = os.path.join(_HERE, script)
+        return [sys.executable, path] if os.path.exists(path) else None
+
+    filename = exe_name + ".exe" if os.name == 'nt' else exe_name
+    # --onefile builds sit side by side in dist/; --onedir builds each get a
+    # folder, so the launcher's sibling is dist/<exe_name>/<filename>
+    candidates = [
+        os.path.join(_HERE, filename),
+        os.path.join(os.path.dirname(_HERE), exe_name, filename),
+    ]
+    for path in candidates:
+        if os.path.isfile(path):
+            return [path]
+    return None
+
+# Resolve the calculators once, and only offer the ones that are actually present
+CALCULATORS = {}
+for _key, (_label, _script, _exe_name) in _CALCULATOR_SCRIPTS.items():
+    _command = _calculator_command(_script, _exe_name)
+    if _command is not None:
+        CALCULATORS[_key] = (_label, _command)
+
 def clear_screen():
     """Clear the console screen."""
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -24,52 +61,60 @@ def print_banner():
 
 def main():
     """Main launcher menu."""
-    clear_screen()
-    print_banner()
-    
-    print("Select your lane:")
-    print()
-    print("  1. Top Lane    (1200 points)")
-    print("  2. Mid Lane    (1350 points)")
-    print("  3. Bot Lane    (1350 points)")
-    print()
-    print("  4. Exit")
-    print()
-    
-    choice = input("Enter your choice (1-4): ").strip()
-    
-    calculators = {
-        '1': 'quest_timer_calculator_top.py',
-        '2': 'quest_timer_calculator.py',
-        '3': 'quest_timer_calculator_bot.py'
-    }
-    
-    if choice in calculators:
-        script = calculators[choice]
-        print(f"\nLaunching {script}...")
-        print("Close the calculator window to return to this menu.\n")
+    running = []  # Calculator processes started from this menu
+    while True:
+        # Reap calculators whose windows have been closed
+        running = [process for process in running if process.poll() is None]
+
+        clear_screen()
+        print_banner()
         
-        try:
-            subprocess.run([sys.executable, script])
-            print("\nCalculator closed.")
-            input("Press Enter to return to menu...")
-            main()  # Return to menu
-        except FileNotFoundError:
-            print(f"\nError: Could not find {script}")
-            print("Make sure all calculator files are in the same directory.")
-            input("\nPress Enter to exit...")
-        except Exception as e:
-            print(f"\nError launching calculator: {e}")
-            input("\nPress Enter to exit...")
-    
-    elif choice == '4':
-        print("\nThank you for using LoL Role Quest Calculator!")
-        sys.exit(0)
-    
-    else:
-        print("\nInvalid choice. Please enter 1, 2, 3, or 4.")
-        input("Press Enter to try again...")
-        main()
+        if running:
+            print(f"Calculators open: {len(running)}")
+            print()
+        print("Select your lane:")
+        print()
+        for key, (label, _) in CALCULATORS.items():
+            print(f"  {key}. {label}")
+        if len(CALCULATORS) < len(_CALCULATOR_SCRIPTS):
+            print()
+            print("  (Some calculators are missing - make sure all calculator")
+            if _FROZEN:
+                print("   .exe files are in the same folder as this launcher.)")
+            else:
+                print("   files are in the same directory as this launcher.)")
+        print()
+        print("  4. Exit")
+        print()
+        
+        choice = input("Enter your choice (1-4): ").strip()
+        
+        if choice in CALCULATORS:
+            command = CALCULATORS[choice][1]
+            print(f"\nLaunching {os.path.basename(command[-1])}...")
+            
+            try:
+                # Don't wait for the window: the menu stays usable, so several
+                # calculators can be open side by side
+                running.append(subprocess.Popen(command))
+                print("The calculator opens in its own window.\n")
+                input("Press Enter to return to menu...")
+                continue  # Return to menu
+            except Exception as e:
+                print(f"\nError launching calculator: {e}")
+                input("\nPress Enter to exit...")
+            return
+        
+        elif choice == '4':
+            if running:
+                print("\nOpen calculator windows stay open until you close them.")
+            print("\nThank you for using LoL Role Quest Calculator!")
+            sys.exit(0)
+        
+        else:
+            options = ", ".join(list(CALCULATORS) + ['4'])
+            print(f"\nInvalid choice. Please enter one of: {options}.")
+            input("Press Enter to try again...")
 
 if __name__ == "__main__":
     try:
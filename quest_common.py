@@ -0,0 +1,508 @@
+"""
+Shared pieces of the League of Legends Role Quest Completion Time Calculators
+
+Every lane calculator (mid, top, bot) imports the lane-independent constants,
+formulas, plotting helpers and the GUI base class from here; the lane scripts
+keep their own point tables, input fields and calculations.
+
+Author: Created for LoL Role Quest Research
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+import numpy as np
+
+
+# ============================================================================
+# CONVERSION FORMULAS - SHARED BY ALL LANES
+# ============================================================================
+
+# Passive generation rate (after 1:05)
+# 8 points every 5 seconds = 96 points per minute
+PASSIVE_POINTS_PER_MINUTE = 96
+
+# Quest generation start time
+PASSIVE_START_TIME = 1 + 5/60  # 1:05 in minutes
+
+# Fixed y-range of the completion plot (percent), with a margin around 0% and 100%
+PLOT_Y_LIMITS = (-5, 110)
+
+# Colors of the comparison lines, reused in order
+COMPARISON_COLORS = ['green', 'orange', 'purple',
+                     'brown', 'pink', 'cyan', 'olive', 'navy']
+
+
+# ============================================================================
+# CALCULATION FUNCTIONS
+# ============================================================================
+
+def calculate_passive_points(time_minutes):
+    """
+    Calculate passive points accumulated over time.
+
+    Args:
+        time_minutes: Game time in minutes (a number or a numpy array)
+
+    Returns:
+        Total passive points at this time (an array of the same shape for array input)
+    """
+    if isinstance(time_minutes, np.ndarray):
+        # Whole curve in one pass: zero before 1:05, linear afterwards
+        return np.maximum(0.0, PASSIVE_POINTS_PER_MINUTE * (time_minutes - PASSIVE_START_TIME))
+
+    if time_minutes <= PASSIVE_START_TIME:
+        # No points before 1:05
+        return 0
+
+    # After 1:05: 96 points per minute
+    time_after_start = time_minutes - PASSIVE_START_TIME
+    points = PASSIVE_POINTS_PER_MINUTE * time_after_start
+
+    return points
+
+
+# ============================================================================
+# PLOTTING HELPERS
+# ============================================================================
+
+class PlotBlitter:
+    """
+    Blit the animated artists of one axes over a cached static background.
+
+    get_artists returns the animated artists in drawing order. After every full
+    draw the axes area is cached, so updating those artists only needs blit().
+    Figure.savefig is wrapped because it skips animated artists.
+    """
+
+    def __init__(self, canvas, ax, get_artists):
+        self.canvas = canvas
+        self.ax = ax
+        self._get_artists = get_artists
+        self._background = None
+        self._saving = False
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+        figure = canvas.figure
+        self._figure_savefig = figure.savefig
+        figure.savefig = self._savefig
+
+    def _draw_artists(self):
+        """Draw the visible animated artists onto the canvas renderer."""
+        for artist in self._get_artists():
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _on_draw(self, event):
+        """Cache the static background after a full draw, then paint the animated artists."""
+        if self._saving:
+            return
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_artists()
+
+    def redraw_full(self):
+        """Schedule a full redraw; blits wait for it and its fresh background."""
+        self._background = None
+        self.canvas.draw_idle()
+
+    def blit(self):
+        """Redraw only the animated artists over the cached background."""
+        if self._background is None:
+            self.redraw_full()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
+
+    def _savefig(self, *args, **kwargs):
+        """Save the figure with the animated artists included."""
+        artists = self._get_artists()
+        for artist in artists:
+            artist.set_animated(False)
+        self._saving = True
+        try:
+            return self._figure_savefig(*args, **kwargs)
+        finally:
+            self._saving = False
+            for artist in artists:
+                artist.set_animated(True)
+            self.redraw_full()
+
+
+# ============================================================================
+# GUI BASE CLASS
+# ============================================================================
+
+class BaseQuestCalculatorGUI:
+    """
+    Window, plot and comparison handling shared by the lane calculator GUIs.
+
+    A lane subclass sets the class attributes below and implements build_inputs(),
+    calculate() and add_comparison(). Comparison scenarios are stored as parallel
+    arrays (one row per scenario in _cmp_time/_cmp_pct, plus _cmp_labels) and shown
+    by a pool of animated lines, see _sync_comparison_lines().
+    """
+
+    LANE_NAME = ''               # e.g. "TOP LANE"
+    TOTAL_QUEST_POINTS = 0
+    BASE_COMPLETION_TIME = 0.0   # passive-only completion time in minutes
+    CURVE_POINTS = 0             # samples per accumulation curve
+    PCT_SCALE = np.float32(0)    # quest points -> completion percentage
+    LEGEND_LOC = 'best'
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title(f"LoL {self.LANE_NAME} Quest Completion Calculator")
+        self.root.geometry("1200x750")
+
+        self._clear_comparison_data()
+        # Tk id of the scheduled calculate(), see _schedule_calculate()
+        self._pending_calculate = None
+        self.setup_ui()
+
+    def _clear_comparison_data(self):
+        """Reset the comparison scenario arrays to zero rows."""
+        self._cmp_time = np.empty((0, self.CURVE_POINTS), dtype=np.float32)
+        self._cmp_pct = np.empty((0, self.CURVE_POINTS), dtype=np.float32)
+        self._cmp_labels = []
+
+    def _append_comparison(self, time_points, quest_points, label):
+        """Append one comparison scenario as a new row of the comparison arrays."""
+        self._cmp_time = np.vstack([self._cmp_time, time_points])
+        self._cmp_pct = np.vstack([self._cmp_pct, self._to_percent(quest_points)])
+        self._cmp_labels.append(label)
+
+    def _to_percent(self, quest_points, out=None):
+        """Convert quest points to completion percentage (float32, capped at 100)."""
+        out = np.multiply(quest_points, self.PCT_SCALE, out=out, dtype=np.float32)
+        return np.minimum(out, np.float32(100), out=out)
+
+    # ---- Window layout ----
+
+    def setup_ui(self):
+        """
+        Initialize the user interface.
+
+        The window is withdrawn while the widgets are built and mapped again once the
+        geometry has been solved, so it appears fully laid out in one step instead of
+        visibly growing widget by widget.
+        """
+        self.root.withdraw()
+
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(
+            tk.W, tk.E, tk.N, tk.S))  # type: ignore
+
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(0, weight=1)
+
+        # Left panel: Input controls
+        input_frame = ttk.LabelFrame(
+            main_frame, text=f"{self.LANE_NAME} Performance Metrics", padding="10")
+        input_frame.grid(row=0, column=0, sticky=(
+            tk.W, tk.E, tk.N, tk.S), padx=(0, 10))  # pyright: ignore[reportArgumentType]
+
+        # Right panel: Graph and results
+        output_frame = ttk.Frame(main_frame)
+        output_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
+        output_frame.rowconfigure(0, weight=1)
+        output_frame.columnconfigure(0, weight=1)
+
+        # ---- Input Fields ----
+        row = self.build_inputs(input_frame)
+
+        # Separator
+        ttk.Separator(input_frame, orient='horizontal').grid(
+            row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
+        row += 1
+
+        # Calculate button
+        ttk.Button(input_frame, text="Calculate Quest Time", command=self._schedule_calculate).grid(
+            row=row, column=0, columnspan=2, pady=10
+        )
+        row += 1
+
+        # Comparison buttons
+        ttk.Button(input_frame, text="Add to Comparison", command=self.add_comparison).grid(
+            row=row, column=0, columnspan=2, pady=5
+        )
+        row += 1
+
+        ttk.Button(input_frame, text="Clear Comparisons", command=self.clear_comparisons).grid(
+            row=row, column=0, columnspan=2, pady=5
+        )
+        row += 1
+
+        # Results text area
+        result_label_frame = ttk.LabelFrame(
+            input_frame, text="Results", padding="10")
+        result_label_frame.grid(row=row, column=0, columnspan=2, sticky=(
+            tk.W, tk.E, tk.N, tk.S), pady=10)
+        input_frame.rowconfigure(row, weight=1)
+
+        self.results_text = tk.Text(
+            result_label_frame, height=12, width=40, wrap=tk.WORD)
+        scrollbar = ttk.Scrollbar(
+            result_label_frame, orient='vertical', command=self.results_text.yview)
+        self.results_text.configure(yscrollcommand=scrollbar.set)
+        self.results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # ---- Graph Area ----
+        self.figure = Figure(figsize=(8, 6), dpi=100)
+        self.ax = self.figure.add_subplot(111)
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=output_frame)
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # Add matplotlib toolbar for zoom/pan
+        toolbar_frame = ttk.Frame(output_frame)
+        toolbar_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
+        toolbar.update()
+
+        self.init_plot()
+        self.plot_baseline()
+
+        self.root.update_idletasks()
+        self.root.deiconify()
+
+    def build_inputs(self, frame):
+        """Create the lane's input fields in frame and return the next free grid row."""
+        raise NotImplementedError
+
+    def add_section(self, frame, row, title):
+        """Add a bold section heading to the input panel and return the next row."""
+        ttk.Label(frame, text=f"=== {title} ===", font=('TkDefaultFont', 10, 'bold')).grid(
+            row=row, column=0, columnspan=2, pady=(0, 5) if row == 0 else (10, 5))
+        return row + 1
+
+    def add_spinbox(self, frame, row, label, variable, from_, to, width=15, increment=None):
+        """Add a labelled Spinbox bound to variable to the input panel and return the next row."""
+        ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+        options = {} if increment is None else {'increment': increment}
+        ttk.Spinbox(frame, from_=from_, to=to, textvariable=variable,
+                    width=width, **options).grid(row=row, column=1, pady=5)
+        return row + 1
+
+    # ---- Calculation scheduling ----
+
+    def _schedule_calculate(self):
+        """
+        Run calculate() once Tk is idle.
+
+        Clicks that arrive while a run is still pending share it, so a burst of clicks
+        only recalculates and redraws once, using the latest inputs.
+        """
+        if self._pending_calculate is None:
+            self._pending_calculate = self.root.after_idle(self._run_pending)
+
+    def _run_pending(self):
+        """Run the scheduled calculation."""
+        self._pending_calculate = None
+        self.calculate()
+
+    def calculate(self):
+        """Calculate and display quest completion time."""
+        raise NotImplementedError
+
+    def add_comparison(self):
+        """Add current scenario to comparison list."""
+        raise NotImplementedError
+
+    # ---- Plotting ----
+
+    def _baseline_curve(self):
+        """Return the passive-only baseline (time, percentage) arrays."""
+        raise NotImplementedError
+
+    def init_plot(self):
+        """
+        Create the plot artists that persist across redraws.
+
+        The baseline curve, completion threshold, axis labels and grid never change, so
+        they are created once here; redraws only update the other artists.
+
+        The current line, comparison lines, extra artists (see _extra_artists) and
+        legend are animated: they are left out of full draws and blitted over the
+        cached static background instead (see PlotBlitter).
+        """
+        baseline_time, baseline_pct = self._baseline_curve()
+        self._baseline_line, = self.ax.plot(baseline_time, baseline_pct, '--',
+                                            color='gray', linewidth=2, alpha=0.7, zorder=1)
+        self._completion_hline = self.ax.axhline(y=100, color='red', linestyle=':',
+                                                 linewidth=2, zorder=0)
+        self._current_line, = self.ax.plot([], [], '-', color='#0066FF',
+                                           linewidth=3, zorder=3, animated=True)
+        self._comparison_lines = []
+        self._shown_comparisons = 0
+        # Lane-specific animated artists, drawn after the current line and listed at
+        # the end of the legend while visible
+        self._extra_artists = []
+        self._legend_handles = []
+
+        self._blitter = PlotBlitter(self.canvas, self.ax, self._animated_artists)
+
+        self._baseline_label = (f'{int(self.BASE_COMPLETION_TIME * 60 // 60)}m'
+                                f'{int(self.BASE_COMPLETION_TIME * 60 % 60)}s Passive Only')
+
+        self.ax.set_xlabel('Game Time (minutes)', fontsize=12)
+        self.ax.set_ylabel('Quest Completion (%)', fontsize=12)
+        self.ax.set_title(f'{self.LANE_NAME} Quest - Completion Progress',
+                          fontsize=14, fontweight='bold')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.set_ylim(*PLOT_Y_LIMITS)
+
+    def plot_baseline(self):
+        """Plot the baseline passive-only accumulation curve."""
+        self._baseline_line.set_label(f'{self._baseline_label} ({self.LANE_NAME.title()})')
+        self._completion_hline.set_label(f'Quest Completion ({self.TOTAL_QUEST_POINTS} pts)')
+        self._current_line.set_visible(False)
+        for artist in self._extra_artists:
+            artist.set_visible(False)
+
+        self._update_legend()
+        self.ax.set_xlim(0, self.BASE_COMPLETION_TIME + 1)
+
+        self._blitter.redraw_full()
+
+    def _use_scenario_labels(self):
+        """Switch the baseline and threshold to their short labels once a scenario is shown."""
+        self._baseline_line.set_label(self._baseline_label)
+        self._completion_hline.set_label('Quest Completion')
+
+    def _animated_artists(self):
+        """Return the animated artists, in drawing order."""
+        artists = [*self._comparison_lines, self._current_line, *self._extra_artists]
+        legend = self.ax.get_legend()
+        if legend is not None:
+            artists.append(legend)
+        return artists
+
+    def _update_legend(self):
+        """
+        Bring the legend up to date with the visible lines.
+
+        If the set of lines is unchanged only the label texts are updated; the legend is
+        rebuilt only when a line was added, removed, shown or hidden.
+        """
+        handles = [self._baseline_line, *self._comparison_lines[:len(self._cmp_labels)]]
+        if self._current_line.get_visible():
+            handles.append(self._current_line)
+        handles.append(self._completion_hline)
+        handles.extend(artist for artist in self._extra_artists if artist.get_visible())
+
+        legend = self.ax.get_legend()
+        if legend is not None and handles == self._legend_handles:
+            for text, handle in zip(legend.get_texts(), handles):
+                text.set_text(handle.get_label())
+            return
+
+        legend = self.ax.legend(handles=handles, loc=self.LEGEND_LOC, framealpha=0.9)
+        legend.set_animated(True)
+        self._legend_handles = handles
+
+    def _sync_comparison_lines(self):
+        """
+        Bring the pooled comparison lines in line with the comparison arrays.
+
+        self._comparison_lines is a pool of animated Line2D artists that only ever grows:
+        line i shows scenario i, and lines beyond the number of scenarios are hidden
+        rather than removed, so they can be reused after Clear Comparisons. Scenarios
+        are only ever appended or all cleared, so only lines whose scenario changed
+        since the last sync are touched.
+        """
+        count = len(self._cmp_labels)
+        while len(self._comparison_lines) < count:
+            line, = self.ax.plot([], [], '-', linewidth=2, alpha=0.7, zorder=2, animated=True)
+            self._comparison_lines.append(line)
+
+        for i in range(self._shown_comparisons, count):
+            line = self._comparison_lines[i]
+            line.set_data(self._cmp_time[i], self._cmp_pct[i])
+            line.set_color(COMPARISON_COLORS[i % len(COMPARISON_COLORS)])
+            line.set_label(self._cmp_labels[i])
+            line.set_visible(True)
+        for line in self._comparison_lines[count:self._shown_comparisons]:
+            line.set_visible(False)
+        self._shown_comparisons = count
+
+    def _update_view(self, completion_time):
+        """
+        Fit the axes to a scenario completing at completion_time and show the changes.
+
+        The lines and legend are animated, so unless an axis range changes (first plot,
+        or the view was zoomed/panned with the toolbar) a blit is enough.
+        """
+        x_limits = (0, max(self.BASE_COMPLETION_TIME, completion_time) + 1)
+        if self.ax.get_xlim() != x_limits or self.ax.get_ylim() != PLOT_Y_LIMITS:
+            self.ax.set_xlim(*x_limits)
+            self.ax.set_ylim(*PLOT_Y_LIMITS)
+            self._blitter.redraw_full()
+        else:
+            self._blitter.blit()
+
+    # ---- Comparisons ----
+
+    def _ask_comparison_label(self, default_label, add):
+        """
+        Ask for the label of a new comparison scenario in a modal dialog.
+
+        OK (or Enter) closes the dialog, calls add(label) with the entered label, or
+        default_label if it was left empty, and confirms the new scenario count.
+        Cancel (or Escape) only closes the dialog.
+        """
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Label Comparison Scenario")
+        dialog.geometry("450x150")
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        ttk.Label(dialog, text="Enter a label for this scenario:",
+                  font=('TkDefaultFont', 10)).pack(pady=10)
+
+        label_var = tk.StringVar(value=default_label)
+        entry = ttk.Entry(dialog, textvariable=label_var, width=60)
+        entry.pack(pady=10)
+        entry.select_range(0, tk.END)
+        entry.focus()
+
+        def on_ok():
+            label = label_var.get().strip() or default_label
+            dialog.destroy()
+            add(label)
+            messagebox.showinfo(
+                "Added", f"Scenario added (Total: {len(self._cmp_labels)})")
+
+        def on_cancel():
+            dialog.destroy()
+
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(pady=10)
+        ttk.Button(button_frame, text="OK", command=on_ok).pack(
+            side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel",
+                   command=on_cancel).pack(side=tk.LEFT, padx=5)
+
+        # Bind Enter key to OK
+        entry.bind('<Return>', lambda e: on_ok())
+        dialog.bind('<Escape>', lambda e: on_cancel())
+
+    def clear_comparisons(self):
+        """
+        Clear all comparison scenarios.
+
+        Only the comparison lines are hidden and the graph is blitted; the current
+        scenario and results text are left as they are.
+        """
+        if not self._cmp_labels:
+            messagebox.showinfo("Info", "No comparisons to clear")
+            return
+        self._clear_comparison_data()
+        self._sync_comparison_lines()
+        self._update_legend()
+        self._blitter.blit()
+        messagebox.showinfo("Cleared", "All comparison scenarios removed")
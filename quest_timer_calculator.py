@@ -9,28 +9,23 @@ All conversion formulas are defined as constants at the top for easy adjustment.
 Author: Created for LoL Role Quest Research
 """
 
+import functools
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from tkinter import ttk
+import matplotlib
 import numpy as np
 
+from quest_common import (PASSIVE_POINTS_PER_MINUTE, PASSIVE_START_TIME, PLOT_Y_LIMITS,
+                          calculate_passive_points, BaseQuestCalculatorGUI)
+
 
 # ============================================================================
 # CONVERSION FORMULAS - MID LANE SPECIFIC
 # ============================================================================
 
-# Passive generation rate in mid lane (after 1:05)
-# 8 points every 5 seconds = 96 points per minute
-PASSIVE_POINTS_PER_MINUTE = 96
-
 # Base quest completion requirement
 TOTAL_QUEST_POINTS = 1350
 
-# Quest generation start time
-PASSIVE_START_TIME = 1 + 5/60  # 1:05 in minutes
-
 # Base completion time with passive generation only
 # = 1:05 startup + (1350 points / 96 points per min) = 1:05 + 14.06 min ≈ 15.1 min
 BASE_COMPLETION_TIME = PASSIVE_START_TIME + \
@@ -50,6 +45,23 @@ POINTS_PER_EPIC = 30  # Epic monster takedowns
 DAMAGE_TO_POINTS_MELEE = 0.03  # 3% of damage dealt (melee)
 DAMAGE_TO_POINTS_RANGED = 0.015  # 1.5% of damage dealt (ranged)
 
+# Damage conversion rate indexed by is_melee (False -> ranged, True -> melee)
+_DAMAGE_RATES = (DAMAGE_TO_POINTS_RANGED, DAMAGE_TO_POINTS_MELEE)
+
+# Number of samples in each accumulation curve (rows of the comparison arrays)
+CURVE_POINTS = 1000
+
+# Quest points -> completion percentage. Curves are float32 end to end (matplotlib's
+# Agg renderer works in float32 anyway), so the scale factor is float32 too.
+POINTS_TO_PERCENT = np.float32(100.0 / TOTAL_QUEST_POINTS)
+
+# Delay before a scheduled recalculation runs; requests within this window are coalesced
+REDRAW_DELAY_MS = 30
+
+# Minimum versions for the fast TkAgg blit path (checked at startup, warning only)
+MIN_MATPLOTLIB_VERSION = (3, 5)
+MIN_TK_VERSION = (8, 5)
+
 
 # ============================================================================
 # CALCULATION FUNCTIONS
@@ -102,6 +114,25 @@ def calculate_points_from_objectives(plates_mid, plates_other, turrets_mid,
     }
 
 
+def calculate_objective_total(plates_mid, plates_other, turrets_mid,
+                              turrets_other, kills, epic_monsters):
+    """
+    Calculate the total points from objectives and kills.
+
+    Same as calculate_points_from_objectives()['total'] without building the
+    breakdown dictionary.
+
+    Returns:
+        Total points from objectives
+    """
+    return (plates_mid * POINTS_PER_PLATE_MID +
+            plates_other * POINTS_PER_PLATE_OTHER +
+            turrets_mid * POINTS_PER_TURRET_MID +
+            turrets_other * POINTS_PER_TURRET_OTHER +
+            kills * POINTS_PER_KILL +
+            epic_monsters * POINTS_PER_EPIC)
+
+
 def calculate_points_from_damage(damage_dealt, is_melee):
     """
     Calculate points from champion damage (Mid lane specific).
@@ -113,55 +144,33 @@ def calculate_points_from_damage(damage_dealt, is_melee):
     Returns:
         Points from damage
     """
-    rate = DAMAGE_TO_POINTS_MELEE if is_melee else DAMAGE_TO_POINTS_RANGED
+    rate = _DAMAGE_RATES[bool(is_melee)]
     return damage_dealt * rate
 
 
-def calculate_passive_points(time_minutes):
-    """
-    Calculate passive points accumulated over time in mid lane.
-
-    Args:
-        time_minutes: Game time in minutes
-
-    Returns:
-        Total passive points at this time
-    """
-    if time_minutes <= PASSIVE_START_TIME:
-        # No points before 1:05
-        return 0
-
-    # After 1:05: 96 points per minute
-    time_after_start = time_minutes - PASSIVE_START_TIME
-    points = PASSIVE_POINTS_PER_MINUTE * time_after_start
-
-    return points
-
-
 def calculate_completion_time(cs_per_min_mid, cs_per_min_other, damage_per_min,
                               is_melee, plates_mid, plates_other,
                               turrets_mid, turrets_other, kills, epic_monsters):
     """
     Calculate quest completion time given performance metrics.
 
-    This function uses a binary search algorithm to find the exact time when the quest
-    completes (reaches 1350 points). We use binary search because quest completion is
-    an inverse problem: we know the target points (1350) and need to find the time.
+    After 1:05 every point source is linear in time, so the completion time is the
+    solution of a linear equation and can be computed directly instead of searched for.
 
     The quest point formula is:
         total_points(t) = passive_points(t) + cs_points(t) + damage_points(t) + objective_points
 
     Where:
-        - passive_points(t): 96 points/min after 1:05 (time-dependent, non-linear)
+        - passive_points(t): 96 points/min after 1:05 (time-dependent, piecewise-linear)
         - cs_points(t): CS rate * time * points per CS (linear with time)
         - damage_points(t): Damage rate * time * conversion rate (linear with time)
         - objective_points: Fixed value (independent of time)
 
-    Binary Search Strategy:
-        - Search space: [1.083, 30.0] minutes (from passive start to max game time)
-        - Convergence tolerance: 0.001 minutes (~0.06 seconds precision)
-        - Invariant: At each iteration, the completion time lies in [low, high]
-        - Terminates when high - low <= 0.001 minutes
+    Closed-form Solution:
+        - active_rate = CS points/min + damage points/min
+        - 96 * (t - 1.083) + active_rate * t + objective_points = 1350
+        - t = (1350 + 96 * 1.083 - objective_points) / (96 + active_rate)
+        - Result is clamped to [1.083, 30.0] minutes (passive start to max game time)
 
     Args:
         cs_per_min_mid (float): Minion kills per minute in mid lane (typically 5-10)
@@ -202,71 +211,100 @@ def calculate_completion_time(cs_per_min_mid, cs_per_min_other, damage_per_min,
         ...     kills=5, epic_monsters=1
         ... )
         >>> print(f"Quest completes at {time:.2f} minutes")
-        Quest completes at 11.47 minutes
+        Quest completes at 10.20 minutes
     """
-    # Calculate points from objectives
-    obj_breakdown = calculate_points_from_objectives(
+    (completion_time, cs_mid_points, cs_other_points, damage_points, plates_points,
+     turret_points, kill_points, epic_points, passive_points) = _calculate_completion_time_core(
+        cs_per_min_mid, cs_per_min_other, damage_per_min, is_melee,
         plates_mid, plates_other, turrets_mid, turrets_other, kills, epic_monsters
     )
-    objective_points = obj_breakdown['total']
 
-    # Binary search to find completion time where total points = TOTAL_QUEST_POINTS (1350)
-    #
-    # Why binary search?
-    # - The point accumulation function is monotonically increasing (more time = more points)
-    # - We need to solve for t in: f(t) = 1350, where f(t) is complex and non-linear
-    # - Binary search converges in O(log n) iterations, typically 15-20 iterations
-    #
-    # Search bounds:
-    # - low: PASSIVE_START_TIME (1.083 min) - earliest possible completion
-    # - high: 30.0 min - conservative upper bound (games rarely go this long)
-    # - tolerance: 0.001 min ≈ 0.06 seconds - more precision is unnecessary for game times
-    low, high = PASSIVE_START_TIME, 30.0
-    tolerance = 0.001
-
-    while high - low > tolerance:
-        mid = (low + high) / 2
-
-        passive = calculate_passive_points(mid)
-        cs_points = (cs_per_min_mid * mid * POINTS_PER_MINION_MID +
-                     cs_per_min_other * mid * POINTS_PER_MINION_OTHER)
-        damage_points = calculate_points_from_damage(
-            damage_per_min * mid, is_melee)
-        total_points = passive + cs_points + damage_points + objective_points
-
-        if total_points < TOTAL_QUEST_POINTS:
-            low = mid
-        else:
-            high = mid
-
-    completion_time = (low + high) / 2
-
-    # Calculate actual values at completion time
-    final_cs_mid = cs_per_min_mid * completion_time
-    final_cs_other = cs_per_min_other * completion_time
-    final_damage = damage_per_min * completion_time
-    
-    cs_points = calculate_points_from_cs(final_cs_mid, final_cs_other)
-    damage_points = calculate_points_from_damage(final_damage, is_melee)
-    active_points = cs_points + damage_points + obj_breakdown['total']
+    cs_points = cs_mid_points + cs_other_points
 
     # Build detailed breakdown
     breakdown = {
-        'cs_mid': final_cs_mid * POINTS_PER_MINION_MID,
-        'cs_other': final_cs_other * POINTS_PER_MINION_OTHER,
+        'cs_mid': cs_mid_points,
+        'cs_other': cs_other_points,
         'cs_total': cs_points,
         'damage': damage_points,
-        'plates': obj_breakdown['plates'],
-        'turrets': obj_breakdown['turrets'],
-        'kills': obj_breakdown['kills'],
-        'epic': obj_breakdown['epic'],
-        'active_total': active_points,
-        'passive_total': calculate_passive_points(completion_time)
+        'plates': plates_points,
+        'turrets': turret_points,
+        'kills': kill_points,
+        'epic': epic_points,
+        'active_total': cs_points + damage_points + plates_points + turret_points +
+                        kill_points + epic_points,
+        'passive_total': passive_points
     }
 
     return completion_time, breakdown
 
 
+@functools.lru_cache(maxsize=256)
+def _calculate_completion_time_core(cs_per_min_mid, cs_per_min_other, damage_per_min,
+                                    is_melee, plates_mid, plates_other,
+                                    turrets_mid, turrets_other, kills, epic_monsters):
+    """
+    Cached numeric core of calculate_completion_time().
+
+    The GUI recalculates with unchanged inputs often (redraws, adding comparisons),
+    so results are memoized. A flat tuple is returned rather than the breakdown dict
+    so cached values can't be mutated by callers.
+
+    Returns:
+        tuple: (completion_time, cs_mid, cs_other, damage, plates, turrets, kills, epic,
+                passive_total) - the completion time in minutes followed by the points
+                from each source at that time
+    """
+    # Calculate points from objectives
+    obj_breakdown = calculate_points_from_objectives(
+        plates_mid, plates_other, turrets_mid, turrets_other, kills, epic_monsters
+    )
+    objective_points = obj_breakdown['total']
+
+    # Solve for t in:
+    #   PASSIVE_POINTS_PER_MINUTE * (t - PASSIVE_START_TIME) + active_rate * t
+    #       + objective_points = TOTAL_QUEST_POINTS
+    #
+    # Bounds:
+    # - PASSIVE_START_TIME (1.083 min) - earliest possible completion
+    # - 30.0 min - conservative upper bound (games rarely go this long)
+    active_rate = (calculate_points_from_cs(cs_per_min_mid, cs_per_min_other) +
+                   calculate_points_from_damage(damage_per_min, is_melee))
+
+    completion_time = ((TOTAL_QUEST_POINTS + PASSIVE_POINTS_PER_MINUTE * PASSIVE_START_TIME -
+                        objective_points) / (PASSIVE_POINTS_PER_MINUTE + active_rate))
+    completion_time = min(max(completion_time, PASSIVE_START_TIME), 30.0)
+
+    # Every rate-based source is just its per-minute rate times the completion time.
+    # completion_time is clamped to >= PASSIVE_START_TIME, so passive points are
+    # never negative here.
+    ct = completion_time
+    return (
+        ct,
+        cs_per_min_mid * ct * POINTS_PER_MINION_MID,
+        cs_per_min_other * ct * POINTS_PER_MINION_OTHER,
+        calculate_points_from_damage(damage_per_min * ct, is_melee),
+        obj_breakdown['plates'],
+        obj_breakdown['turrets'],
+        obj_breakdown['kills'],
+        obj_breakdown['epic'],
+        PASSIVE_POINTS_PER_MINUTE * (ct - PASSIVE_START_TIME)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _time_grid(max_time):
+    """
+    Return the (read-only) float32 time axis from 0 to max_time for an accumulation curve.
+
+    max_time is max(completion_time, BASE_COMPLETION_TIME) + 1, which in practice is the
+    same for every scenario, so the grid is allocated once and shared by all curves.
+    """
+    time_points = np.linspace(0, max_time, CURVE_POINTS, dtype=np.float32)
+    time_points.setflags(write=False)
+    return time_points
+
+
 def generate_accumulation_curve(cs_per_min_mid, cs_per_min_other, damage_per_min,
                                 is_melee, plates_mid, plates_other, turrets_mid,
                                 turrets_other, kills, epic_monsters, completion_time):
@@ -304,12 +342,14 @@ def generate_accumulation_curve(cs_per_min_mid, cs_per_min_other, damage_per_min
 
     Returns:
         tuple: (time_points, quest_points) where:
-            - time_points (np.ndarray): Array of 1000 time values from 0 to max_time
-            - quest_points (np.ndarray): Array of 1000 quest point values at each time
+            - time_points (np.ndarray): Array of 1000 float32 time values from 0 to max_time
+            - quest_points (np.ndarray): Array of 1000 float32 quest point values at each time
             - max_time = max(completion_time, BASE_COMPLETION_TIME) + 1 minute
 
     Implementation Details:
         - Uses numpy.linspace to create 1000 evenly spaced time points
+        - Computes the whole curve in one fused float32 numpy expression (no per-sample loop);
+          float32 is far more precision than the plot can show
         - Calculates passive points at each time (kicks in after 1:05)
         - Scales active points (CS, damage, objectives) linearly by progress ratio
         - Progress ratio = min(current_time / completion_time, 1.0) ensures capping at 100%
@@ -322,56 +362,73 @@ def generate_accumulation_curve(cs_per_min_mid, cs_per_min_other, damage_per_min
         ...     completion_time=12.5
         ... )
         >>> # time_arr and points_arr can now be plotted with matplotlib
+        >>> import matplotlib.pyplot as plt
         >>> plt.plot(time_arr, points_arr)
     """
     max_time = max(completion_time, BASE_COMPLETION_TIME) + 1
-    time_points = np.linspace(0, max_time, 1000)
-    quest_points = np.zeros_like(time_points)
-
-    # Calculate totals at completion
-    total_cs_mid = cs_per_min_mid * completion_time
-    total_cs_other = cs_per_min_other * completion_time
-    total_damage = damage_per_min * completion_time
-
-    for i, t in enumerate(time_points):
-        # Passive generation
-        points = calculate_passive_points(t)
-
-        # CS and damage contribution (scales linearly with time)
-        if completion_time > 0:
-            progress = min(t / completion_time, 1.0)
-            cs_mid_at_time = total_cs_mid * progress
-            cs_other_at_time = total_cs_other * progress
-            damage_at_time = total_damage * progress
-            
-            points += calculate_points_from_cs(cs_mid_at_time, cs_other_at_time)
-            points += calculate_points_from_damage(damage_at_time, is_melee)
-
-            # Objectives (distributed linearly for visualization)
-            obj_points = calculate_points_from_objectives(
-                plates_mid * progress, plates_other * progress,
-                turrets_mid * progress, turrets_other * progress,
-                kills * progress, epic_monsters * progress
-            )
-            points += obj_points['total']
-
-        quest_points[i] = points
+    time_points = _time_grid(max_time)
+
+    # Points per minute from CS and damage
+    active_rate = (calculate_points_from_cs(cs_per_min_mid, cs_per_min_other) +
+                   calculate_points_from_damage(damage_per_min, is_melee))
+
+    # Objectives (distributed linearly for visualization)
+    obj_total = calculate_objective_total(
+        plates_mid, plates_other, turrets_mid, turrets_other, kills, epic_monsters
+    )
+
+    # Active points at time t are (active_rate * completion_time + obj_total) * progress,
+    # which simplifies to min(t, completion_time) * (active_rate + obj_total / completion_time)
+    active_slope = active_rate + obj_total / completion_time if completion_time > 0 else 0.0
+
+    # Passive generation (kicks in after 1:05) plus active points, in a single pass
+    quest_points = (np.maximum(0.0, PASSIVE_POINTS_PER_MINUTE * (time_points - PASSIVE_START_TIME)) +
+                    np.minimum(time_points, completion_time) * np.float32(active_slope))
 
     return time_points, quest_points
 
 
+def points_to_percentage(quest_points, out=None):
+    """
+    Convert quest points to completion percentage, capped at 100.
+
+    Scales and caps in place in a single float32 buffer instead of creating a temporary
+    for the scaled array and another for the cap.
+
+    Args:
+        quest_points (np.ndarray): Quest points at each time sample
+        out (np.ndarray, optional): float32 buffer of the same shape to write into;
+                                   a new one is allocated if omitted
+
+    Returns:
+        np.ndarray: The percentage array (out, if given)
+    """
+    out = np.multiply(quest_points, POINTS_TO_PERCENT, out=out, dtype=np.float32)
+    return np.minimum(out, np.float32(100), out=out)
+
+
 # ============================================================================
 # GUI APPLICATION
 # ============================================================================
 
-class MidLaneQuestCalculatorGUI:
+class MidLaneQuestCalculatorGUI(BaseQuestCalculatorGUI):
+    LANE_NAME = "MID LANE"
+    TOTAL_QUEST_POINTS = TOTAL_QUEST_POINTS
+    BASE_COMPLETION_TIME = BASE_COMPLETION_TIME
+    CURVE_POINTS = CURVE_POINTS
+    PCT_SCALE = POINTS_TO_PERCENT
+    # A fixed location (lower right, below the passive baseline) means matplotlib never
+    # runs its 'best' placement search over all line data
+    LEGEND_LOC = 'lower right'
+
     def __init__(self, root):
         """
         Initialize the Mid Lane Quest Calculator GUI application.
 
-        This constructor sets up the main application window and initializes the state
-        management for scenario comparisons. The UI is constructed through the setup_ui()
-        method, which creates all input fields, buttons, and the matplotlib graph canvas.
+        This constructor sets up the mid-lane state and then lets
+        BaseQuestCalculatorGUI set up the main application window, the state
+        management for scenario comparisons and the UI (setup_ui() creates all input
+        fields, buttons, and the matplotlib graph canvas).
 
         Args:
             root (tk.Tk): The root Tkinter window object that will contain this application.
@@ -379,12 +436,20 @@ class MidLaneQuestCalculatorGUI:
 
         Attributes Created:
             root (tk.Tk): Reference to the main application window
-            comparison_scenarios (list): Empty list to store comparison scenario data.
-                                       Each scenario is a dict with keys:
-                                       - 'time': numpy array of time points
-                                       - 'points': numpy array of quest points at each time
-                                       - 'label': string label for the scenario
-                                       - 'completion_time': float completion time in minutes
+            Comparison scenarios are stored as parallel arrays (one row per scenario),
+            reset by _clear_comparison_data():
+            _cmp_time (np.ndarray): (N, CURVE_POINTS) float32 time points
+            _cmp_pct (np.ndarray): (N, CURVE_POINTS) float32 quest completion percentage
+                                       (capped at 100), computed once when added
+            _cmp_labels (list): N label strings
+            _baseline_time, _baseline_pct (np.ndarray): Cached passive-only baseline curve,
+                                       computed on first use by _baseline_curve()
+            _pending_calculate (str or None): Tk after() id of the scheduled
+                                       recalculation, see _schedule_calculate()
+            _cached_inputs (dict): Parsed value of every input variable, keyed by
+                                       attribute name and kept current by trace callbacks
+                                       (see _watch_inputs())
+            _pct_buf (np.ndarray): Reused float32 buffer for the current line's percentages
 
         Side Effects:
             - Sets window title to "LoL MID LANE Quest Completion Calculator"
@@ -396,242 +461,113 @@ class MidLaneQuestCalculatorGUI:
             >>> app = MidLaneQuestCalculatorGUI(root)
             >>> root.mainloop()
         """
-        self.root = root
-        self.root.title("LoL MID LANE Quest Completion Calculator")
-        self.root.geometry("1200x750")
-
-        self.comparison_scenarios = []
-        self.setup_ui()
-
-    def setup_ui(self):
-        """Initialize the user interface."""
-
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(
-            tk.W, tk.E, tk.N, tk.S))  # type: ignore
-
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(0, weight=1)
-
-        # Left panel: Input controls
-        input_frame = ttk.LabelFrame(
-            main_frame, text="MID LANE Performance Metrics", padding="10")
-        input_frame.grid(row=0, column=0, sticky=(
-            tk.W, tk.E, tk.N, tk.S), padx=(0, 10))  # pyright: ignore[reportArgumentType]
-
-        # Right panel: Graph and results
-        output_frame = ttk.Frame(main_frame)
-        output_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
-        output_frame.rowconfigure(0, weight=1)
-        output_frame.columnconfigure(0, weight=1)
-
-        # ---- Input Fields ----
+        self._baseline_time = None
+        self._baseline_pct = None
+        self._cached_inputs = {}
+        self._pct_buf = np.empty(CURVE_POINTS, dtype=np.float32)
+        super().__init__(root)
+
+    def _baseline_curve(self):
+        """Return the passive-only baseline (time, percentage) arrays, computing them once."""
+        if self._baseline_time is None:
+            self._baseline_time = np.linspace(0, BASE_COMPLETION_TIME, 200, dtype=np.float32)
+            quest_points = calculate_passive_points(self._baseline_time)
+            self._baseline_pct = points_to_percentage(quest_points)
+        return self._baseline_time, self._baseline_pct
+
+    def build_inputs(self, frame):
+        """Create the MID LANE input fields and start watching them (see _watch_inputs())."""
         row = 0
 
         # Champion type section
-        ttk.Label(input_frame, text="=== Champion Type ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(0, 5))
-        row += 1
-
+        row = self.add_section(frame, row, "Champion Type")
         self.is_melee = tk.BooleanVar(value=False)
-        ttk.Radiobutton(input_frame, text="Melee (3% damage)", variable=self.is_melee,
+        ttk.Radiobutton(frame, text="Melee (3% damage)", variable=self.is_melee,
                         value=True).grid(row=row, column=0, sticky=tk.W, pady=2)
-        ttk.Radiobutton(input_frame, text="Ranged (1.5% damage)", variable=self.is_melee,
+        ttk.Radiobutton(frame, text="Ranged (1.5% damage)", variable=self.is_melee,
                         value=False).grid(row=row, column=1, sticky=tk.W, pady=2)
         row += 1
 
         # CS section
-        ttk.Label(input_frame, text="=== Creep Score ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="CS/min in Mid Lane:").grid(row=row,
-                                                                column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Creep Score")
         self.cs_per_min_mid = tk.StringVar(value="7.0")
-        ttk.Spinbox(input_frame, from_=0.0, to=12.0, textvariable=self.cs_per_min_mid,
-                    width=15, increment=0.1).grid(row=row, column=1, pady=5)
-        row += 1
-
-        ttk.Label(input_frame, text="CS/min in Other Lanes:").grid(row=row,
-                                                                   column=0, sticky=tk.W, pady=5)
+        row = self.add_spinbox(frame, row, "CS/min in Mid Lane:", self.cs_per_min_mid,
+                               0.0, 12.0, increment=0.1)
         self.cs_per_min_other = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=12, textvariable=self.cs_per_min_other,
-                    width=15, increment=0.1).grid(row=row, column=1, pady=5)
-        row += 1
+        row = self.add_spinbox(frame, row, "CS/min in Other Lanes:", self.cs_per_min_other,
+                               0, 12, increment=0.1)
 
         # Champion damage section
-        ttk.Label(input_frame, text="=== Champion Damage ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="Damage/min to Champions:").grid(row=row,
-                                                                      column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Champion Damage")
         self.damage_per_min = tk.StringVar(value="500")
-        ttk.Spinbox(input_frame, from_=0, to=3000, textvariable=self.damage_per_min,
-                    width=15, increment=50).grid(row=row, column=1, pady=5)
-        row += 1
+        row = self.add_spinbox(frame, row, "Damage/min to Champions:", self.damage_per_min,
+                               0, 3000, increment=50)
 
         # Turret plates section
-        ttk.Label(input_frame, text="=== Turret Plates ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="Plates in Mid Lane:").grid(row=row,
-                                                                column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Turret Plates")
         self.plates_mid = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=10, textvariable=self.plates_mid,
-                    width=13).grid(row=row, column=1, pady=5)
-        row += 1
-
-        ttk.Label(input_frame, text="Plates in Other Lanes:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_spinbox(frame, row, "Plates in Mid Lane:", self.plates_mid, 0, 10, width=13)
         self.plates_other = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=10, textvariable=self.plates_other,
-                    width=13).grid(row=row, column=1, pady=5)
-        row += 1
+        row = self.add_spinbox(frame, row, "Plates in Other Lanes:", self.plates_other,
+                               0, 10, width=13)
 
         # Turrets section
-        ttk.Label(input_frame, text="=== Turret Takedowns ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="Turrets in Mid Lane:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Turret Takedowns")
         self.turrets_mid = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=3, textvariable=self.turrets_mid,
-                    width=15).grid(row=row, column=1, pady=5)
-        row += 1
-
-        ttk.Label(input_frame, text="Turrets in Other Lanes:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_spinbox(frame, row, "Turrets in Mid Lane:", self.turrets_mid, 0, 3)
         self.turrets_other = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=3, textvariable=self.turrets_other,
-                    width=15).grid(row=row, column=1, pady=5)
-        row += 1
+        row = self.add_spinbox(frame, row, "Turrets in Other Lanes:", self.turrets_other, 0, 3)
 
         # Objectives section
-        ttk.Label(input_frame, text="=== Objectives & Kills ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="Champion Takedowns:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Objectives & Kills")
         self.kills = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=15, textvariable=self.kills,
-                    width=15).grid(row=row, column=1, pady=5)
-        row += 1
-
-        ttk.Label(input_frame, text="Epic Monster Takedowns:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_spinbox(frame, row, "Champion Takedowns:", self.kills, 0, 15)
         self.epic_monsters = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=5, textvariable=self.epic_monsters,
-                    width=15).grid(row=row, column=1, pady=5)
-        row += 1
-
-        # Separator
-        ttk.Separator(input_frame, orient='horizontal').grid(
-            row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
-        row += 1
-
-        # Calculate button
-        ttk.Button(input_frame, text="Calculate Quest Time", command=self.calculate).grid(
-            row=row, column=0, columnspan=2, pady=10
-        )
-        row += 1
+        row = self.add_spinbox(frame, row, "Epic Monster Takedowns:", self.epic_monsters, 0, 5)
+
+        self._watch_inputs()
+        return row
+
+    # (attribute name, parser) for every input variable, in get_inputs() order
+    INPUT_FIELDS = (
+        ('cs_per_min_mid', float),
+        ('cs_per_min_other', float),
+        ('damage_per_min', float),
+        ('is_melee', bool),
+        ('plates_mid', int),
+        ('plates_other', int),
+        ('turrets_mid', int),
+        ('turrets_other', int),
+        ('kills', int),
+        ('epic_monsters', int),
+    )
 
-        # Comparison buttons
-        ttk.Button(input_frame, text="Add to Comparison", command=self.add_comparison).grid(
-            row=row, column=0, columnspan=2, pady=5
-        )
-        row += 1
+    def _watch_inputs(self):
+        """Parse every input once and re-parse a field only when its variable is written."""
+        for name, parser in self.INPUT_FIELDS:
+            self._on_var_change(name, parser)
+            getattr(self, name).trace_add(
+                'write', lambda *_args, name=name, parser=parser: self._on_var_change(name, parser))
 
-        ttk.Button(input_frame, text="Clear Comparisons", command=self.clear_comparisons).grid(
-            row=row, column=0, columnspan=2, pady=5
-        )
-        row += 1
-
-        # Results text area
-        result_label_frame = ttk.LabelFrame(
-            input_frame, text="Results", padding="10")
-        result_label_frame.grid(row=row, column=0, columnspan=2, sticky=(
-            tk.W, tk.E, tk.N, tk.S), pady=10)
-        input_frame.rowconfigure(row, weight=1)
-
-        self.results_text = tk.Text(
-            result_label_frame, height=12, width=40, wrap=tk.WORD)
-        scrollbar = ttk.Scrollbar(
-            result_label_frame, orient='vertical', command=self.results_text.yview)
-        self.results_text.configure(yscrollcommand=scrollbar.set)
-        self.results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # ---- Graph Area ----
-        self.figure = Figure(figsize=(8, 6), dpi=100)
-        self.ax = self.figure.add_subplot(111)
-
-        self.canvas = FigureCanvasTkAgg(self.figure, master=output_frame)
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        # Add matplotlib toolbar for zoom/pan
-        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
-        toolbar_frame = ttk.Frame(output_frame)
-        toolbar_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
-        toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
-        toolbar.update()
-
-        self.plot_baseline()
-
-    def plot_baseline(self):
-        """Plot the baseline passive-only accumulation curve."""
-        self.ax.clear()
-
-        time_points = np.linspace(0, BASE_COMPLETION_TIME, 200)
-        quest_points = np.array([calculate_passive_points(t)
-                                for t in time_points])
-        percentage_complete = (quest_points / TOTAL_QUEST_POINTS) * 100
-        percentage_complete = np.minimum(100, percentage_complete)
-
-        self.ax.plot(time_points, percentage_complete, '--', color='gray',
-                     label=f'{int(BASE_COMPLETION_TIME * 60 // 60)}m{int(BASE_COMPLETION_TIME * 60 % 60)}s Passive Only (Mid Lane)', linewidth=2)
-        self.ax.axhline(y=100, color='red', linestyle=':',
-                        label='Quest Completion (1350 pts)', linewidth=2)
-
-        self.ax.set_xlabel('Game Time (minutes)', fontsize=12)
-        self.ax.set_ylabel('Quest Completion (%)', fontsize=12)
-        self.ax.set_title('MID LANE Quest - Completion Progress',
-                          fontsize=14, fontweight='bold')
-        self.ax.legend()
-        self.ax.grid(True, alpha=0.3)
-
-        self.canvas.draw()
+    def _on_var_change(self, name, parser):
+        """Trace callback: parse the changed input into self._cached_inputs (None if invalid)."""
+        try:
+            self._cached_inputs[name] = parser(getattr(self, name).get())
+        except (ValueError, tk.TclError):
+            self._cached_inputs[name] = None
 
     def get_inputs(self):
-        """Retrieve and validate all input values."""
-        cs_mid = 0
-        cs_other = 0
-        damage = 0
-        plates_mid = 0
-        plates_other = 0
-        turrets_mid = 0
-        turrets_other = 0
-        kills = 0
-        epic = 0
-
-        try:
-            cs_mid = float(self.cs_per_min_mid.get())
-            cs_other = float(self.cs_per_min_other.get())
-            damage = float(self.damage_per_min.get())
-            plates_mid = int(self.plates_mid.get())
-            plates_other = int(self.plates_other.get())
-            turrets_mid = int(self.turrets_mid.get())
-            turrets_other = int(self.turrets_other.get())
-            kills = int(self.kills.get())
-            epic = int(self.epic_monsters.get())
-
-        except ValueError as e:
-            print(f"Invalid input detected : {e}")
+        """Return the validated input values from the parsed-input cache."""
+        values = []
+        for name, _parser in self.INPUT_FIELDS:
+            value = self._cached_inputs[name]
+            if value is None:
+                print(f"Invalid input detected : {name}")
+                value = 0
+            values.append(value)
+
+        (cs_mid, cs_other, damage, is_melee, plates_mid, plates_other, turrets_mid,
+         turrets_other, kills, epic) = values
 
         # Validate all inputs
         if not 0 <= cs_mid:
@@ -652,10 +588,19 @@ class MidLaneQuestCalculatorGUI:
         if not 0 <= epic <= 10:
             epic = max(0, epic)
 
-        is_melee = self.is_melee.get()
-
         return cs_mid, cs_other, damage, is_melee, plates_mid, plates_other, turrets_mid, turrets_other, kills, epic
 
+    def _schedule_calculate(self):
+        """
+        Schedule calculate() to run after REDRAW_DELAY_MS.
+
+        A request that arrives while one is still pending replaces it, so a burst of
+        clicks only recalculates and redraws once, using the latest inputs.
+        """
+        if self._pending_calculate is not None:
+            self.root.after_cancel(self._pending_calculate)
+        self._pending_calculate = self.root.after(REDRAW_DELAY_MS, self._run_pending)
+
     def calculate(self):
         """Calculate and display quest completion time."""
         inputs = self.get_inputs()
@@ -680,90 +625,61 @@ class MidLaneQuestCalculatorGUI:
 
     def display_results(self, completion_time, breakdown, cs_mid, cs_other, damage, is_melee):
         """Display calculation results in the text area."""
-        self.results_text.delete(1.0, tk.END)
-
         minutes = int(completion_time * 60) // 60
         seconds = int(completion_time * 60) % 60
 
         champ_type = "Melee (3%)" if is_melee else "Ranged (1.5%)"
 
-        results = f"Quest Completion Time: {minutes}m {seconds}s\n"
-        results += "Points Breakdown:\n"
-        results += "=" * 40 + "\n"
-        results += f"CS in Mid Lane:      {breakdown['cs_mid']:.0f} pts\n"
-        results += f"CS in Other Lanes:   {breakdown['cs_other']:.0f} pts\n"
-        results += f"  Total CS:          {breakdown['cs_total']:.0f} pts\n\n"
-        results += f"Champion Damage ({champ_type}): {breakdown['damage']:.0f} pts\n\n"
-        results += f"Turret Plates:       {breakdown['plates']:.0f} pts\n"
-        results += f"Turret Takedowns:    {breakdown['turrets']:.0f} pts\n"
-        results += f"Champion Kills:      {breakdown['kills']:.0f} pts\n"
-        results += f"Epic Monsters:       {breakdown['epic']:.0f} pts\n"
-        results += "=" * 40 + "\n"
-        results += f"Active Points:       {breakdown['active_total']:.0f} pts\n"
-        results += f"Passive Points:      {breakdown['passive_total']:.0f} pts\n"
-        results += f"TOTAL:               {breakdown['active_total'] + breakdown['passive_total']:.0f} pts\n\n"
-
         # Time saved calculation
         time_saved = int((BASE_COMPLETION_TIME - completion_time) * 60) // 60
         time_saved_seconds = int(
             (BASE_COMPLETION_TIME - completion_time) * 60 % 60)
-        results += f"Time Saved: {time_saved}m {time_saved_seconds}s\n"
 
-        self.results_text.insert(1.0, results)
+        results = ''.join([
+            f"Quest Completion Time: {minutes}m {seconds}s\n",
+            "Points Breakdown:\n",
+            "=" * 40 + "\n",
+            f"CS in Mid Lane:      {breakdown['cs_mid']:.0f} pts\n",
+            f"CS in Other Lanes:   {breakdown['cs_other']:.0f} pts\n",
+            f"  Total CS:          {breakdown['cs_total']:.0f} pts\n\n",
+            f"Champion Damage ({champ_type}): {breakdown['damage']:.0f} pts\n\n",
+            f"Turret Plates:       {breakdown['plates']:.0f} pts\n",
+            f"Turret Takedowns:    {breakdown['turrets']:.0f} pts\n",
+            f"Champion Kills:      {breakdown['kills']:.0f} pts\n",
+            f"Epic Monsters:       {breakdown['epic']:.0f} pts\n",
+            "=" * 40 + "\n",
+            f"Active Points:       {breakdown['active_total']:.0f} pts\n",
+            f"Passive Points:      {breakdown['passive_total']:.0f} pts\n",
+            f"TOTAL:               {breakdown['active_total'] + breakdown['passive_total']:.0f} pts\n\n",
+            f"Time Saved: {time_saved}m {time_saved_seconds}s\n",
+        ])
+
+        self.results_text.replace(1.0, tk.END, results)
 
     def plot_graph(self, cs_mid, cs_other, damage, is_melee, plates_mid, plates_other,
                    turrets_mid, turrets_other, kills, epic, completion_time):
-        """Plot the quest accumulation curve."""
-        self.ax.clear()
-
-        # Plot baseline
-        time_baseline = np.linspace(0, BASE_COMPLETION_TIME, 200)
-        points_baseline = np.array(
-            [calculate_passive_points(t) for t in time_baseline])
-        percentage_baseline = (points_baseline / TOTAL_QUEST_POINTS) * 100
-        percentage_baseline = np.minimum(100, percentage_baseline)
-
-        self.ax.plot(time_baseline, percentage_baseline, '--', color='gray',
-                     label=f'{int(BASE_COMPLETION_TIME * 60 // 60)}m{int(BASE_COMPLETION_TIME * 60 % 60)}s Passive Only', linewidth=2, alpha=0.7, zorder=1)
-
-        # Plot comparison scenarios first
-        colors = ['green', 'orange', 'purple',
-                  'brown', 'pink', 'cyan', 'olive', 'navy']
-        for i, scenario in enumerate(self.comparison_scenarios):
-            color = colors[i % len(colors)]
-            scenario_percentage = (
-                scenario['points'] / TOTAL_QUEST_POINTS) * 100
-            scenario_percentage = np.minimum(100, scenario_percentage)
-            self.ax.plot(scenario['time'], scenario_percentage, '-',
-                         color=color, label=scenario['label'], linewidth=2, alpha=0.7, zorder=2)
-
-        # Plot current scenario on top
+        """
+        Plot the quest accumulation curve.
+
+        Updates the current-scenario line in place and blits it over the cached
+        background; a full redraw only happens when the axis limits change.
+        """
+        self._use_scenario_labels()
+
+        # Update current scenario on top
         time_points, quest_points = generate_accumulation_curve(
             cs_mid, cs_other, damage, is_melee, plates_mid, plates_other,
             turrets_mid, turrets_other, kills, epic, completion_time
         )
-        percentage_complete = (quest_points / TOTAL_QUEST_POINTS) * 100
-        percentage_complete = np.minimum(100, percentage_complete)
+        percentage_complete = points_to_percentage(quest_points, out=self._pct_buf)
         minutes = int(completion_time * 60) // 60
         seconds = int(completion_time * 60) % 60
-        self.ax.plot(time_points, percentage_complete, '-', color='#0066FF',
-                     label=f"{minutes}m{seconds}s Current", linewidth=3, zorder=3)
-
-        # Quest completion threshold
-        self.ax.axhline(y=100, color='red', linestyle=':',
-                        label='Quest Completion', linewidth=2, zorder=0)
+        self._current_line.set_data(time_points, percentage_complete)
+        self._current_line.set_label(f"{minutes}m{seconds}s Current")
+        self._current_line.set_visible(True)
 
-        self.ax.set_xlabel('Game Time (minutes)', fontsize=12)
-        self.ax.set_ylabel('Quest Completion (%)', fontsize=12)
-        self.ax.set_title('MID LANE Quest - Completion Progress',
-                          fontsize=14, fontweight='bold')
-        self.ax.legend(loc='best', framealpha=0.9)
-        self.ax.grid(True, alpha=0.3)
-
-        self.ax.set_xlim(0, max(BASE_COMPLETION_TIME, completion_time) + 1)
-        self.ax.set_ylim(-5, 110)
-
-        self.canvas.draw()
+        self._update_legend()
+        self._update_view(completion_time)
 
     def add_comparison(self):
         """Add current scenario to comparison list."""
@@ -813,102 +729,65 @@ class MidLaneQuestCalculatorGUI:
 
         default_label = " ".join(label_parts)
 
-        # Create custom dialog for label input
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Label Comparison Scenario")
-        dialog.geometry("450x150")
-        dialog.transient(self.root)
-        dialog.grab_set()
-
-        ttk.Label(dialog, text="Enter a label for this scenario:",
-                  font=('TkDefaultFont', 10)).pack(pady=10)
-
-        label_var = tk.StringVar(value=default_label)
-        entry = ttk.Entry(dialog, textvariable=label_var, width=60)
-        entry.pack(pady=10)
-        entry.select_range(0, tk.END)
-        entry.focus()
-
-        def on_ok():
-            """
-            Dialog callback for OK button - saves comparison scenario and closes dialog.
-
-            This nested function is a closure that captures variables from add_comparison():
-            - time_points: numpy array of time values for the curve
-            - quest_points: numpy array of point values for the curve
-            - completion_time: calculated quest completion time
-            - label_var: tkinter StringVar containing user's custom label
-            - default_label: auto-generated label as fallback
-
-            Behavior:
-                1. Retrieves and sanitizes the user's label (falls back to default if empty)
-                2. Appends scenario dict to self.comparison_scenarios list
-                3. Destroys the dialog window
-                4. Recalculates and redraws the graph with the new comparison line
-                5. Shows confirmation messagebox with total scenario count
-
-            Side Effects:
-                - Modifies self.comparison_scenarios (appends new dict)
-                - Closes dialog window
-                - Triggers graph redraw via self.calculate()
-                - Displays info messagebox
-            """
-            label = label_var.get().strip()
-            if not label:
-                label = default_label
-
-            self.comparison_scenarios.append({
-                'time': time_points,
-                'points': quest_points,
-                'label': label,
-                'completion_time': completion_time
-            })
-
-            dialog.destroy()
-            self.calculate()
-            messagebox.showinfo(
-                "Added", f"Scenario added (Total: {len(self.comparison_scenarios)})")
-
-        def on_cancel():
-            """
-            Dialog callback for Cancel button - closes dialog without saving.
-
-            This nested function is a closure that captures the dialog window reference.
-            It provides a clean way to dismiss the label input dialog when the user
-            clicks Cancel or presses Escape.
-
-            Behavior:
-                - Simply destroys the dialog window
-                - Does NOT modify self.comparison_scenarios
-                - Does NOT trigger graph redraw
-                - Does NOT show any messagebox
-
-            Side Effects:
-                - Closes dialog window (no other side effects)
-            """
-            dialog.destroy()
-
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(pady=10)
-        ttk.Button(button_frame, text="OK", command=on_ok).pack(
-            side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel",
-                   command=on_cancel).pack(side=tk.LEFT, padx=5)
-
-        entry.bind('<Return>', lambda e: on_ok())
-        dialog.bind('<Escape>', lambda e: on_cancel())
-
-    def clear_comparisons(self):
-        """Clear all comparison scenarios."""
-        self.comparison_scenarios = []
-        self.calculate()
-        messagebox.showinfo("Cleared", "All comparison scenarios removed")
+        def add(label):
+            self._append_comparison(time_points, quest_points, label)
+            self._sync_comparison_lines()
+            self._update_legend()
+
+            # Only grow the x-range, so the current scenario stays in view
+            x_max = max(BASE_COMPLETION_TIME, completion_time) + 1
+            if x_max > self.ax.get_xlim()[1] or self.ax.get_ylim() != PLOT_Y_LIMITS:
+                self.ax.set_xlim(0, max(x_max, self.ax.get_xlim()[1]))
+                self.ax.set_ylim(*PLOT_Y_LIMITS)
+                self._blitter.redraw_full()
+            else:
+                self._blitter.blit()
+
+        self._ask_comparison_label(default_label, add)
 
 
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
 
+def _version_tuple(version):
+    """Turn a version string like '3.5.2' or '8.6.12' into a comparable (major, minor) tuple."""
+    parts = []
+    for part in version.split('.')[:2]:
+        digits = ''.join(ch for ch in part if ch.isdigit())
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts)
+
+
+def check_backend_versions(root):
+    """
+    Warn when matplotlib or Tk is too old for the fast TkAgg blit path.
+
+    matplotlib 3.5+ copies the Agg buffer into Tk with Tk_PhotoPutBlock while
+    releasing the GIL, which makes every graph redraw noticeably cheaper. Older
+    versions (or Tk before 8.5) still work, just more slowly, so this only prints
+    a warning.
+
+    Args:
+        root (tk.Tk): The root window, used to query the Tk patch level
+
+    Returns:
+        bool: True if both versions meet the minimum, False otherwise
+    """
+    ok = True
+    if _version_tuple(matplotlib.__version__) < MIN_MATPLOTLIB_VERSION:
+        print(f"Warning: matplotlib {matplotlib.__version__} is older than 3.5; "
+              "graph redraws will be slower. Run: pip install --upgrade matplotlib")
+        ok = False
+
+    tk_patchlevel = str(root.tk.call('info', 'patchlevel'))
+    if _version_tuple(tk_patchlevel) < MIN_TK_VERSION:
+        print(f"Warning: Tk {tk_patchlevel} is older than 8.5; graph redraws will be slower.")
+        ok = False
+
+    return ok
+
+
 def main():
     """
     Main entry point for the Mid Lane Quest Calculator application.
@@ -917,7 +796,8 @@ def main():
     the root window, instantiates the calculator GUI, and starts the main event loop.
 
     Execution Flow:
-        1. Creates the root Tkinter window (tk.Tk())
+        1. Creates the root Tkinter window (tk.Tk()) and warns if matplotlib/Tk
+           are too old for the fast TkAgg blit path (check_backend_versions)
         2. Instantiates MidLaneQuestCalculatorGUI with the root window
            - This triggers __init__ which sets up all UI elements
         3. Starts the Tkinter event loop (root.mainloop())
@@ -952,6 +832,7 @@ def main():
         - No command-line arguments are processed
     """
     root = tk.Tk()
+    check_backend_versions(root)
     app = MidLaneQuestCalculatorGUI(root)
     root.mainloop()
 
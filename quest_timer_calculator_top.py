@@ -9,28 +9,23 @@ All conversion formulas are defined as constants at the top for easy adjustment.
 Author: Created for LoL Role Quest Research
 """
 
+import functools
+import re
 import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from typing import NamedTuple
 import numpy as np
 
+from quest_common import (PASSIVE_POINTS_PER_MINUTE, PASSIVE_START_TIME,
+                          calculate_passive_points, BaseQuestCalculatorGUI)
+
 
 # ============================================================================
 # CONVERSION FORMULAS - TOP LANE SPECIFIC
 # ============================================================================
 
-# Passive generation rate in top lane (after 1:05)
-# 8 points every 5 seconds = 96 points per minute
-PASSIVE_POINTS_PER_MINUTE = 96
-
 # Base quest completion requirement
 TOTAL_QUEST_POINTS = 1200
 
-# Quest generation start time
-PASSIVE_START_TIME = 1 + 5/60  # 1:05 in minutes
-
 # Base completion time with passive generation only
 # = 1:05 startup + (1200 points / 96 points per min) = 1:05 + 12.5 min ≈ 13.6 min
 BASE_COMPLETION_TIME = PASSIVE_START_TIME + \
@@ -46,6 +41,19 @@ POINTS_PER_PLATE_TOP = 40  # Turret plates in top lane
 POINTS_PER_PLATE_OTHER = 20  # Turret plates in other lanes
 POINTS_PER_EPIC = 30  # Epic monster takedowns
 
+# Samples per accumulation curve. The curve is piecewise linear (knees at 1:05 and at
+# completion), so 200 points is already finer than the plot can show.
+CURVE_POINTS = 200
+
+# Quest points -> completion percentage, as a single multiply. Curves are float32 (plenty
+# for a 0-100% plot and what matplotlib's Agg renderer uses), so the scale is too.
+_PCT_SCALE = np.float32(100.0 / TOTAL_QUEST_POINTS)
+
+# Input formats accepted by float() and int(); entries are checked against these instead
+# of catching the ValueError of a failed conversion
+_FLOAT_RE = re.compile(r'^\s*[-+]?(?:\d+\.?\d*|\.\d+)\s*$')
+_INT_RE = re.compile(r'^\s*[-+]?\d+\s*$')
+
 
 # ============================================================================
 # CALCULATION FUNCTIONS
@@ -98,25 +106,17 @@ def calculate_points_from_objectives(plates_top, plates_other, turrets_top,
     }
 
 
-def calculate_passive_points(time_minutes):
-    """
-    Calculate passive points accumulated over time in top lane.
-
-    Args:
-        time_minutes: Game time in minutes
-
-    Returns:
-        Total passive points at this time
-    """
-    if time_minutes <= PASSIVE_START_TIME:
-        # No points before 1:05
-        return 0
-
-    # After 1:05: 96 points per minute
-    time_after_start = time_minutes - PASSIVE_START_TIME
-    points = PASSIVE_POINTS_PER_MINUTE * time_after_start
-
-    return points
+class PointsBreakdown(NamedTuple):
+    """Points earned by each source at quest completion."""
+    cs_top: float
+    cs_other: float
+    cs_total: float
+    plates: float
+    turrets: float
+    kills: float
+    epic: float
+    active_total: float
+    passive_total: float
 
 
 def calculate_completion_time(cs_per_min_top, cs_per_min_other, plates_top, plates_other,
@@ -126,9 +126,22 @@ def calculate_completion_time(cs_per_min_top, cs_per_min_other, plates_top, plat
 
     FIXED: Now properly handles CS as rates (per minute) instead of totals.
 
+    The search itself is memoized (_calculate_completion_time_cached), so pressing
+    Calculate and then Add to Comparison with the same inputs only searches once.
+
     Returns:
-        Tuple of (completion_time, points_breakdown)
+        Tuple of (completion_time, PointsBreakdown)
     """
+    return _calculate_completion_time_cached(
+        cs_per_min_top, cs_per_min_other, plates_top, plates_other,
+        turrets_top, turrets_other, kills, epic_monsters
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _calculate_completion_time_cached(cs_per_min_top, cs_per_min_other, plates_top, plates_other,
+                                      turrets_top, turrets_other, kills, epic_monsters):
+    """Cached body of calculate_completion_time; PointsBreakdown is immutable, so it is shared."""
     # Calculate points from objectives
     obj_breakdown = calculate_points_from_objectives(
         plates_top, plates_other, turrets_top, turrets_other, kills, epic_monsters
@@ -140,13 +153,15 @@ def calculate_completion_time(cs_per_min_top, cs_per_min_other, plates_top, plat
     low, high = PASSIVE_START_TIME, 30.0
     tolerance = 0.001
 
+    # CS points are linear in time, so the per-minute rate is loop-invariant
+    cs_rate = (cs_per_min_top * POINTS_PER_MINION_TOP +
+               cs_per_min_other * POINTS_PER_MINION_OTHER)
+
     while high - low > tolerance:
         mid = (low + high) / 2
 
-        passive = calculate_passive_points(mid)
-        cs_points = (cs_per_min_top * mid * POINTS_PER_MINION_TOP +
-                     cs_per_min_other * mid * POINTS_PER_MINION_OTHER)
-        total_points = passive + cs_points + objective_points
+        passive = max(0.0, PASSIVE_POINTS_PER_MINUTE * (mid - PASSIVE_START_TIME))
+        total_points = passive + cs_rate * mid + objective_points
 
         if total_points < TOTAL_QUEST_POINTS:
             low = mid
@@ -162,17 +177,17 @@ def calculate_completion_time(cs_per_min_top, cs_per_min_other, plates_top, plat
     active_points = cs_points + obj_breakdown['total']
 
     # Build detailed breakdown
-    breakdown = {
-        'cs_top': final_cs_top * POINTS_PER_MINION_TOP,
-        'cs_other': final_cs_other * POINTS_PER_MINION_OTHER,
-        'cs_total': cs_points,
-        'plates': obj_breakdown['plates'],
-        'turrets': obj_breakdown['turrets'],
-        'kills': obj_breakdown['kills'],
-        'epic': obj_breakdown['epic'],
-        'active_total': active_points,
-        'passive_total': calculate_passive_points(completion_time)
-    }
+    breakdown = PointsBreakdown(
+        cs_top=final_cs_top * POINTS_PER_MINION_TOP,
+        cs_other=final_cs_other * POINTS_PER_MINION_OTHER,
+        cs_total=cs_points,
+        plates=obj_breakdown['plates'],
+        turrets=obj_breakdown['turrets'],
+        kills=obj_breakdown['kills'],
+        epic=obj_breakdown['epic'],
+        active_total=active_points,
+        passive_total=calculate_passive_points(completion_time)
+    )
 
     return completion_time, breakdown
 
@@ -183,258 +198,136 @@ def generate_accumulation_curve(cs_per_min_top, cs_per_min_other, plates_top,
     """
     Generate point accumulation curve over time.
 
+    Memoized on the inputs (they fully determine the curve); the returned arrays are
+    shared between calls and therefore read-only.
+
     Returns:
         Tuple of (time_array, points_array) for plotting
     """
+    return _accumulation_curve_cached(cs_per_min_top, cs_per_min_other, plates_top,
+                                      plates_other, turrets_top, turrets_other,
+                                      kills, epic_monsters, completion_time)
+
+
+@functools.lru_cache(maxsize=128)
+def _accumulation_curve_cached(cs_per_min_top, cs_per_min_other, plates_top,
+                               plates_other, turrets_top, turrets_other,
+                               kills, epic_monsters, completion_time):
+    """Cached body of generate_accumulation_curve."""
     max_time = max(completion_time, BASE_COMPLETION_TIME) + 1
-    time_points = np.linspace(0, max_time, 1000)
-    quest_points = np.zeros_like(time_points)
-
-    # Calculate total CS and objectives at completion
-    total_cs_top = cs_per_min_top * completion_time
-    total_cs_other = cs_per_min_other * completion_time
-
-    for i, t in enumerate(time_points):
-        # Passive generation (with top lane boost)
-        points = calculate_passive_points(t)
-
-        # CS contribution (scales linearly with time)
-        if completion_time > 0:
-            progress = min(t / completion_time, 1.0)
-            cs_top_at_time = total_cs_top * progress
-            cs_other_at_time = total_cs_other * progress
-            points += calculate_points_from_cs(cs_top_at_time,
-                                               cs_other_at_time)
-
-            # Objectives (distributed linearly for visualization)
-            obj_points = calculate_points_from_objectives(
-                plates_top * progress, plates_other * progress,
-                turrets_top * progress, turrets_other * progress,
-                kills * progress, epic_monsters * progress
-            )
-            points += obj_points['total']
-
-        quest_points[i] = points
+    # Evenly spaced samples from 0 to max_time: one multiply per sample, unlike linspace
+    time_points = np.arange(CURVE_POINTS, dtype=np.float32) * np.float32(max_time / (CURVE_POINTS - 1))
+
+    # CS and objectives both scale with progress = min(t / completion_time, 1),
+    # so together they are min(t, completion_time) times a single slope
+    cs_rate = calculate_points_from_cs(cs_per_min_top, cs_per_min_other)
+    obj_total = calculate_points_from_objectives(
+        plates_top, plates_other, turrets_top, turrets_other, kills, epic_monsters
+    )['total']
+    active_slope = cs_rate + obj_total / completion_time if completion_time > 0 else 0.0
 
+    quest_points = (calculate_passive_points(time_points) +
+                    np.minimum(time_points, completion_time) * active_slope)
+
+    time_points.setflags(write=False)
+    quest_points.setflags(write=False)
     return time_points, quest_points
 
 
+# Passive-only baseline curve; it depends on constants only, so compute it once
+_BASELINE_TIME = np.linspace(0, BASE_COMPLETION_TIME, 200, dtype=np.float32)
+# Passive percentage per minute, folded once; clipping at 0 covers the time before 1:05
+_BASELINE_PCT_PER_MIN = PASSIVE_POINTS_PER_MINUTE * _PCT_SCALE
+_BASELINE_PCT = np.clip((_BASELINE_TIME - PASSIVE_START_TIME) * _BASELINE_PCT_PER_MIN, 0.0, 100.0)
+_BASELINE_TIME.flags.writeable = False
+_BASELINE_PCT.flags.writeable = False
+
+
 # ============================================================================
 # GUI APPLICATION
 # ============================================================================
 
-class TopLaneQuestCalculatorGUI:
+class TopLaneQuestCalculatorGUI(BaseQuestCalculatorGUI):
+    LANE_NAME = "TOP LANE"
+    TOTAL_QUEST_POINTS = TOTAL_QUEST_POINTS
+    BASE_COMPLETION_TIME = BASE_COMPLETION_TIME
+    CURVE_POINTS = CURVE_POINTS
+    PCT_SCALE = _PCT_SCALE
+
     def __init__(self, root):
-        self.root = root
-        self.root.title("LoL TOP LANE Quest Completion Calculator")
-        self.root.geometry("1200x750")
-
-        self.comparison_scenarios = []
-        self.setup_ui()
-
-    def setup_ui(self):
-        """Initialize the user interface."""
-
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(
-            tk.W, tk.E, tk.N, tk.S))  # type: ignore
-
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(0, weight=1)
-
-        # Left panel: Input controls
-        input_frame = ttk.LabelFrame(
-            main_frame, text="TOP LANE Performance Metrics", padding="10")
-        input_frame.grid(row=0, column=0, sticky=(
-            tk.W, tk.E, tk.N, tk.S), padx=(0, 10))  # pyright: ignore[reportArgumentType]
-
-        # Right panel: Graph and results
-        output_frame = ttk.Frame(main_frame)
-        output_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S))
-        output_frame.rowconfigure(0, weight=1)
-        output_frame.columnconfigure(0, weight=1)
-
-        # ---- Input Fields ----
+        # Reused for the current scenario's percentages on every redraw
+        self._pct_buf = np.empty(CURVE_POINTS, dtype=np.float32)
+        super().__init__(root)
+
+    def build_inputs(self, frame):
+        """Create the TOP LANE input fields."""
         row = 0
 
         # CS section
-        ttk.Label(input_frame, text="=== Creep Score ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(0, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="CS/min in Top Lane:").grid(row=row,
-                                                                column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Creep Score")
         self.cs_per_min_top = tk.StringVar(value="7.0")
-        ttk.Spinbox(input_frame, from_=0.0, to=12.0, textvariable=self.cs_per_min_top,
-                    width=15, increment=0.1).grid(row=row, column=1, pady=5)
-        row += 1
-
-        ttk.Label(input_frame, text="CS/min in Other Lanes:").grid(row=row,
-                                                                   column=0, sticky=tk.W, pady=5)
+        row = self.add_spinbox(frame, row, "CS/min in Top Lane:", self.cs_per_min_top,
+                               0.0, 12.0, increment=0.1)
         self.cs_per_min_other = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=12, textvariable=self.cs_per_min_other,
-                    width=15, increment=0.1).grid(row=row, column=1, pady=5)
-        row += 1
+        row = self.add_spinbox(frame, row, "CS/min in Other Lanes:", self.cs_per_min_other,
+                               0, 12, increment=0.1)
 
         # Turret plates section
-        ttk.Label(input_frame, text="=== Turret Plates ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="Plates in Top Lane:").grid(row=row,
-                                                                column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Turret Plates")
         self.plates_top = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=10, textvariable=self.plates_top,
-                    width=13).grid(row=row, column=1, pady=5)
-        row += 1
-
-        ttk.Label(input_frame, text="Plates in Other Lanes:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_spinbox(frame, row, "Plates in Top Lane:", self.plates_top, 0, 10, width=13)
         self.plates_other = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=10, textvariable=self.plates_other,
-                    width=13).grid(row=row, column=1, pady=5)
-        row += 1
+        row = self.add_spinbox(frame, row, "Plates in Other Lanes:", self.plates_other,
+                               0, 10, width=13)
 
         # Turrets section
-        ttk.Label(input_frame, text="=== Turret Takedowns ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="Turrets in Top Lane:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Turret Takedowns")
         self.turrets_top = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=3, textvariable=self.turrets_top,
-                    width=15).grid(row=row, column=1, pady=5)
-        row += 1
-
-        ttk.Label(input_frame, text="Turrets in Other Lanes:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_spinbox(frame, row, "Turrets in Top Lane:", self.turrets_top, 0, 3)
         self.turrets_other = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=3, textvariable=self.turrets_other,
-                    width=15).grid(row=row, column=1, pady=5)
-        row += 1
+        row = self.add_spinbox(frame, row, "Turrets in Other Lanes:", self.turrets_other, 0, 3)
 
         # Objectives section
-        ttk.Label(input_frame, text="=== Objectives & Kills ===", font=('TkDefaultFont', 10, 'bold')).grid(
-            row=row, column=0, columnspan=2, pady=(10, 5))
-        row += 1
-
-        ttk.Label(input_frame, text="Champion Takedowns:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_section(frame, row, "Objectives & Kills")
         self.kills = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=15, textvariable=self.kills,
-                    width=15).grid(row=row, column=1, pady=5)
-        row += 1
-
-        ttk.Label(input_frame, text="Epic Monster Takedowns:").grid(
-            row=row, column=0, sticky=tk.W, pady=5)
+        row = self.add_spinbox(frame, row, "Champion Takedowns:", self.kills, 0, 15)
         self.epic_monsters = tk.StringVar(value="0")
-        ttk.Spinbox(input_frame, from_=0, to=5, textvariable=self.epic_monsters,
-                    width=15).grid(row=row, column=1, pady=5)
-        row += 1
-
-        # Separator
-        ttk.Separator(input_frame, orient='horizontal').grid(
-            row=row, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
-        row += 1
-
-        # Calculate button
-        ttk.Button(input_frame, text="Calculate Quest Time", command=self.calculate).grid(
-            row=row, column=0, columnspan=2, pady=10
-        )
-        row += 1
-
-        # Comparison buttons
-        ttk.Button(input_frame, text="Add to Comparison", command=self.add_comparison).grid(
-            row=row, column=0, columnspan=2, pady=5
-        )
-        row += 1
-
-        ttk.Button(input_frame, text="Clear Comparisons", command=self.clear_comparisons).grid(
-            row=row, column=0, columnspan=2, pady=5
-        )
-        row += 1
-
-        # Results text area
-        result_label_frame = ttk.LabelFrame(
-            input_frame, text="Results", padding="10")
-        result_label_frame.grid(row=row, column=0, columnspan=2, sticky=(
-            tk.W, tk.E, tk.N, tk.S), pady=10)
-        input_frame.rowconfigure(row, weight=1)
-
-        self.results_text = tk.Text(
-            result_label_frame, height=12, width=40, wrap=tk.WORD)
-        scrollbar = ttk.Scrollbar(
-            result_label_frame, orient='vertical', command=self.results_text.yview)
-        self.results_text.configure(yscrollcommand=scrollbar.set)
-        self.results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # ---- Graph Area ----
-        self.figure = Figure(figsize=(8, 6), dpi=100)
-        self.ax = self.figure.add_subplot(111)
-
-        self.canvas = FigureCanvasTkAgg(self.figure, master=output_frame)
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        # Add matplotlib toolbar for zoom/pan
-        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
-        toolbar_frame = ttk.Frame(output_frame)
-        toolbar_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
-        toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
-        toolbar.update()
-
-        self.plot_baseline()
-
-    def plot_baseline(self):
-        """Plot the baseline passive-only accumulation curve."""
-        self.ax.clear()
-
-        time_points = np.linspace(0, BASE_COMPLETION_TIME, 200)
-        quest_points = np.array([calculate_passive_points(t)
-                                for t in time_points])
-        percentage_complete = (quest_points / TOTAL_QUEST_POINTS) * 100
-        percentage_complete = np.minimum(100, percentage_complete)
-
-        self.ax.plot(time_points, percentage_complete, '--', color='gray',
-                     label=f'{int(BASE_COMPLETION_TIME * 60 // 60)}m{int(BASE_COMPLETION_TIME * 60 % 60)}s Passive Only (Top Lane)', linewidth=2)
-        self.ax.axhline(y=100, color='red', linestyle=':',
-                        label='Quest Completion (1200 pts)', linewidth=2)
-
-        self.ax.set_xlabel('Game Time (minutes)', fontsize=12)
-        self.ax.set_ylabel('Quest Completion (%)', fontsize=12)
-        self.ax.set_title('TOP LANE Quest - Completion Progress',
-                          fontsize=14, fontweight='bold')
-        self.ax.legend()
-        self.ax.grid(True, alpha=0.3)
-
-        self.canvas.draw()
+        row = self.add_spinbox(frame, row, "Epic Monster Takedowns:", self.epic_monsters, 0, 5)
+
+        return row
+
+    def _baseline_curve(self):
+        """Return the passive-only baseline curve computed at import."""
+        return _BASELINE_TIME, _BASELINE_PCT
+
+    # Input variables with the pattern they must match and the type they are parsed to
+    INPUT_FIELDS = (
+        ('cs_per_min_top', _FLOAT_RE, float),
+        ('cs_per_min_other', _FLOAT_RE, float),
+        ('plates_top', _INT_RE, int),
+        ('plates_other', _INT_RE, int),
+        ('turrets_top', _INT_RE, int),
+        ('turrets_other', _INT_RE, int),
+        ('kills', _INT_RE, int),
+        ('epic_monsters', _INT_RE, int),
+    )
 
     def get_inputs(self):
         """Retrieve and validate all input values."""
-        cs_top = 0
-        cs_other = 0
-        plates_top = 0
-        plates_other = 0
-        turrets_top = 0
-        turrets_other = 0
-        kills = 0
-        epic = 0
-
-        try:
-            cs_top = float(self.cs_per_min_top.get())
-            cs_other = float(self.cs_per_min_other.get())
-            plates_top = int(self.plates_top.get())
-            plates_other = int(self.plates_other.get())
-            turrets_top = int(self.turrets_top.get())
-            turrets_other = int(self.turrets_other.get())
-            kills = int(self.kills.get())
-            epic = int(self.epic_monsters.get())
-
-        except ValueError as e:
-            print(f"Invalid input detected : {e}")
+        values = []
+        invalid = []
+        for name, pattern, parser in self.INPUT_FIELDS:
+            text = getattr(self, name).get()
+            if pattern.match(text):
+                values.append(parser(text))
+            else:
+                invalid.append(name)
+                values.append(0)
+
+        if invalid:
+            print(f"Invalid input detected : {', '.join(invalid)}")
+
+        cs_top, cs_other, plates_top, plates_other, turrets_top, turrets_other, kills, epic = values
 
         # Validate all inputs
         if not 0 <= cs_top:
@@ -476,89 +369,65 @@ class TopLaneQuestCalculatorGUI:
         self.plot_graph(cs_top, cs_other, plates_top, plates_other,
                         turrets_top, turrets_other, kills, epic, completion_time)
 
+    def _refresh_plot_only(self, completion_time, breakdown, cs_top, cs_other,
+                           time_points, quest_points):
+        """Show already computed results without re-reading or recalculating the inputs."""
+        self.display_results(completion_time, breakdown, cs_top, cs_other)
+        self._plot_current(time_points, quest_points, completion_time)
+
     def display_results(self, completion_time, breakdown, cs_top, cs_other):
         """Display calculation results in the text area."""
-        self.results_text.delete(1.0, tk.END)
-
         minutes = int(completion_time * 60) // 60
         seconds = int(completion_time * 60) % 60
 
-        results = f"Quest Completion Time: {minutes}m {seconds}s\n"
-        results += "Points Breakdown:\n"
-        results += "=" * 40 + "\n"
-        results += f"CS in Top Lane:      {breakdown['cs_top']:.0f} pts\n"
-        results += f"CS in Other Lanes:   {breakdown['cs_other']:.0f} pts\n"
-        results += f"  Total CS:          {breakdown['cs_total']:.0f} pts\n\n"
-        results += f"Turret Plates:       {breakdown['plates']:.0f} pts\n"
-        results += f"Turret Takedowns:    {breakdown['turrets']:.0f} pts\n"
-        results += f"Champion Kills:      {breakdown['kills']:.0f} pts\n"
-        results += f"Epic Monsters:       {breakdown['epic']:.0f} pts\n"
-        results += "=" * 40 + "\n"
-        results += f"Active Points:       {breakdown['active_total']:.0f} pts\n"
-        results += f"Passive Points:      {breakdown['passive_total']:.0f} pts\n"
-        results += f"TOTAL:               {breakdown['active_total'] + breakdown['passive_total']:.0f} pts\n\n"
-
         # Time saved calculation
         time_saved = int((BASE_COMPLETION_TIME - completion_time) * 60) // 60
         time_saved_seconds = int(
             (BASE_COMPLETION_TIME - completion_time) * 60 % 60)
-        results += f"Time Saved: {time_saved}m {time_saved_seconds}s\n"
 
-        self.results_text.insert(1.0, results)
+        results = ''.join([
+            f"Quest Completion Time: {minutes}m {seconds}s\n",
+            "Points Breakdown:\n",
+            "=" * 40 + "\n",
+            f"CS in Top Lane:      {breakdown.cs_top:.0f} pts\n",
+            f"CS in Other Lanes:   {breakdown.cs_other:.0f} pts\n",
+            f"  Total CS:          {breakdown.cs_total:.0f} pts\n\n",
+            f"Turret Plates:       {breakdown.plates:.0f} pts\n",
+            f"Turret Takedowns:    {breakdown.turrets:.0f} pts\n",
+            f"Champion Kills:      {breakdown.kills:.0f} pts\n",
+            f"Epic Monsters:       {breakdown.epic:.0f} pts\n",
+            "=" * 40 + "\n",
+            f"Active Points:       {breakdown.active_total:.0f} pts\n",
+            f"Passive Points:      {breakdown.passive_total:.0f} pts\n",
+            f"TOTAL:               {breakdown.active_total + breakdown.passive_total:.0f} pts\n\n",
+            f"Time Saved: {time_saved}m {time_saved_seconds}s\n",
+        ])
+
+        self.results_text.replace(1.0, tk.END, results)
 
     def plot_graph(self, cs_top, cs_other, plates_top, plates_other,
                    turrets_top, turrets_other, kills, epic, completion_time):
         """Plot the quest accumulation curve."""
-        self.ax.clear()
-
-        # Plot baseline
-        time_baseline = np.linspace(0, BASE_COMPLETION_TIME, 200)
-        points_baseline = np.array(
-            [calculate_passive_points(t) for t in time_baseline])
-        percentage_baseline = (points_baseline / TOTAL_QUEST_POINTS) * 100
-        percentage_baseline = np.minimum(100, percentage_baseline)
-
-        self.ax.plot(time_baseline, percentage_baseline, '--', color='gray',
-                     label=f'{int(BASE_COMPLETION_TIME * 60 // 60)}m{int(BASE_COMPLETION_TIME * 60 % 60)}s Passive Only', linewidth=2, alpha=0.7, zorder=1)
-
-        # Plot comparison scenarios first (so they appear behind current scenario)
-        colors = ['green', 'orange', 'purple',
-                  'brown', 'pink', 'cyan', 'olive', 'navy']
-        for i, scenario in enumerate(self.comparison_scenarios):
-            color = colors[i % len(colors)]
-            scenario_percentage = (
-                scenario['points'] / TOTAL_QUEST_POINTS) * 100
-            scenario_percentage = np.minimum(100, scenario_percentage)
-            self.ax.plot(scenario['time'], scenario_percentage, '-',
-                         color=color, label=scenario['label'], linewidth=2, alpha=0.7, zorder=2)
-
-        # Plot current scenario on top with bright blue
         time_points, quest_points = generate_accumulation_curve(
             cs_top, cs_other, plates_top, plates_other,
             turrets_top, turrets_other, kills, epic, completion_time
         )
-        percentage_complete = (quest_points / TOTAL_QUEST_POINTS) * 100
-        percentage_complete = np.minimum(100, percentage_complete)
-        minutes = int(completion_time * 60) // 60
-        seconds = int(completion_time * 60) % 60
-        self.ax.plot(time_points, percentage_complete, '-', color='#0066FF',
-                     label=f"{minutes}m{seconds}s Current", linewidth=3, zorder=3)
+        self._plot_current(time_points, quest_points, completion_time)
 
-        # Quest completion threshold (now at y=100%)
-        self.ax.axhline(y=100, color='red', linestyle=':',
-                        label='Quest Completion', linewidth=2, zorder=0)
+    def _plot_current(self, time_points, quest_points, completion_time):
+        """Show a computed accumulation curve as the current scenario."""
+        self._use_scenario_labels()
 
-        self.ax.set_xlabel('Game Time (minutes)', fontsize=12)
-        self.ax.set_ylabel('Quest Completion (%)', fontsize=12)
-        self.ax.set_title('TOP LANE Quest - Completion Progress',
-                          fontsize=14, fontweight='bold')
-        self.ax.legend(loc='best', framealpha=0.9)
-        self.ax.grid(True, alpha=0.3)
-
-        self.ax.set_xlim(0, max(BASE_COMPLETION_TIME, completion_time) + 1)
-        self.ax.set_ylim(-5, 110)
+        # Update current scenario (drawn on top of the comparison lines)
+        percentage_complete = self._to_percent(quest_points, out=self._pct_buf)
+        minutes = int(completion_time * 60) // 60
+        seconds = int(completion_time * 60) % 60
+        self._current_line.set_data(time_points, percentage_complete)
+        self._current_line.set_label(f"{minutes}m{seconds}s Current")
+        self._current_line.set_visible(True)
 
-        self.canvas.draw()
+        self._update_legend()
+        self._update_view(completion_time)
 
     def add_comparison(self):
         """Add current scenario to comparison list."""
@@ -569,7 +438,7 @@ class TopLaneQuestCalculatorGUI:
         cs_top, cs_other, plates_top, plates_other, turrets_top, turrets_other, kills, epic = inputs
 
         # FIXED: Pass CS rates (per minute), not totals
-        completion_time, _ = calculate_completion_time(
+        completion_time, breakdown = calculate_completion_time(
             cs_top,  # CS per minute
             cs_other,  # CS per minute
             plates_top, plates_other,
@@ -606,58 +475,14 @@ class TopLaneQuestCalculatorGUI:
 
         default_label = " ".join(label_parts)
 
-        # Create custom dialog for label input
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Label Comparison Scenario")
-        dialog.geometry("450x150")
-        dialog.transient(self.root)
-        dialog.grab_set()
-
-        ttk.Label(dialog, text="Enter a label for this scenario:",
-                  font=('TkDefaultFont', 10)).pack(pady=10)
-
-        label_var = tk.StringVar(value=default_label)
-        entry = ttk.Entry(dialog, textvariable=label_var, width=60)
-        entry.pack(pady=10)
-        entry.select_range(0, tk.END)
-        entry.focus()
-
-        def on_ok():
-            label = label_var.get().strip()
-            if not label:
-                label = default_label
-
-            self.comparison_scenarios.append({
-                'time': time_points,
-                'points': quest_points,
-                'label': label,
-                'completion_time': completion_time
-            })
-
-            dialog.destroy()
-            self.calculate()
-            messagebox.showinfo(
-                "Added", f"Scenario added (Total: {len(self.comparison_scenarios)})")
-
-        def on_cancel():
-            dialog.destroy()
-
-        button_frame = ttk.Frame(dialog)
-        button_frame.pack(pady=10)
-        ttk.Button(button_frame, text="OK", command=on_ok).pack(
-            side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel",
-                   command=on_cancel).pack(side=tk.LEFT, padx=5)
-
-        # Bind Enter key to OK
-        entry.bind('<Return>', lambda e: on_ok())
-        dialog.bind('<Escape>', lambda e: on_cancel())
-
-    def clear_comparisons(self):
-        """Clear all comparison scenarios."""
-        self.comparison_scenarios = []
-        self.calculate()
-        messagebox.showinfo("Cleared", "All comparison scenarios removed")
+        def add(label):
+            self._append_comparison(time_points, quest_points, label)
+            self._sync_comparison_lines()
+            # The added scenario is the current one, so reuse its results
+            self._refresh_plot_only(completion_time, breakdown, cs_top, cs_other,
+                                    time_points, quest_points)
+
+        self._ask_comparison_label(default_label, add)
 
 
 # ============================================================================